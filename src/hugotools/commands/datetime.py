@@ -7,16 +7,22 @@ Only modifies files when the datetime differs from the metadata.
 """
 
 import argparse
+import math
 import os
 import sys
 from datetime import datetime
+from functools import lru_cache
 from typing import List
 
 from hugotools.common import (
+    BANNER,
+    ContentDirMissing,
     HugoPost,
     HugoPostManager,
     add_common_args,
     add_post_selection_args,
+    format_heading,
+    make_frontmatter_cache,
     validate_post_selection_args,
 )
 
@@ -24,7 +30,9 @@ from hugotools.common import (
 class DatetimeSynchronizer(HugoPostManager):
     """Synchronizes file modification times with frontmatter dates."""
 
-    def synchronize_datetimes(self, posts: List[HugoPost], dry_run: bool = False) -> int:
+    def synchronize_datetimes(
+        self, posts: List[HugoPost], dry_run: bool = False, quiet: bool = False
+    ) -> int:
         """Update file modification times to match frontmatter dates."""
         modified_count = 0
         skipped_count = 0
@@ -35,54 +43,50 @@ class DatetimeSynchronizer(HugoPostManager):
             post_date = post.get_date()
 
             if not post_date:
-                print(f"[SKIP] {post.file_path.name}: No valid date in frontmatter")
+                if not quiet:
+                    print(f"[SKIP] {post.file_name}: No valid date in frontmatter")
                 skipped_count += 1
                 continue
 
-            # Get current file modification time
-            file_stat = post.file_path.stat()
-            file_mtime = datetime.fromtimestamp(file_stat.st_mtime)
+            # Get current file modification time (stat captured when posts were loaded)
+            file_stat = post.get_stat()
 
-            # Compare dates (ignore microseconds)
-            post_date_truncated = post_date.replace(microsecond=0)
-            file_mtime_truncated = file_mtime.replace(microsecond=0)
-
-            if post_date_truncated == file_mtime_truncated:
+            # Compare whole seconds (ignore microseconds)
+            timestamp = post_date.timestamp()
+            if math.floor(timestamp) == file_stat.st_mtime_ns // 1_000_000_000:
                 # Already synchronized
                 continue
 
             modified_count += 1
-            status = "[DRY RUN] " if dry_run else ""
+            if not quiet:
+                status = "[DRY RUN] " if dry_run else ""
+                file_mtime = datetime.fromtimestamp(file_stat.st_mtime)
 
-            print(f"{status}{post.file_path.name}:")
-            print(f"  Frontmatter date: {post_date.strftime('%Y-%m-%d %H:%M:%S')}")
-            print(f"  File mtime:       {file_mtime.strftime('%Y-%m-%d %H:%M:%S')}")
-            print("  → Setting file mtime to match frontmatter date")
+                print(f"{status}{post.file_name}:")
+                print(f"  Frontmatter date: {post_date.strftime('%Y-%m-%d %H:%M:%S')}")
+                print(f"  File mtime:       {file_mtime.strftime('%Y-%m-%d %H:%M:%S')}")
+                print("  → Setting file mtime to match frontmatter date")
 
             # Update file modification time if not dry run
             if not dry_run:
                 try:
-                    # Convert datetime to timestamp
-                    timestamp = post_date.timestamp()
-
                     # Update both access time and modification time
                     os.utime(post.file_path, (timestamp, timestamp))
+                    post.refresh_stat()
 
                 except Exception as e:
-                    print(f"  ERROR: Failed to update file time: {e}")
+                    if quiet:
+                        # The post's details were not printed, so name it here
+                        print(f"ERROR: {post.file_name}: Failed to update file time: {e}")
+                    else:
+                        print(f"  ERROR: Failed to update file time: {e}")
                     error_count += 1
                     modified_count -= 1
 
         return modified_count, skipped_count, error_count
 
 
-def run(args=None):
-    """Run the datetime synchronizer command."""
-    parser = argparse.ArgumentParser(
-        prog="hugotools datetime",
-        description="Synchronize Hugo post file modification times with frontmatter dates",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+EPILOG = """
 Examples:
   # Sync all posts
   hugotools datetime --all
@@ -101,7 +105,17 @@ Examples:
 
   # Dry run to see what would change
   hugotools datetime --all --dry-run
-        """,
+        """
+
+
+@lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the datetime command's argument parser, once per process."""
+    parser = argparse.ArgumentParser(
+        prog="hugotools datetime",
+        description="Synchronize Hugo post file modification times with frontmatter dates",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=EPILOG,
     )
 
     # Post selection (using common function, without --text since it's not useful for datetime sync)
@@ -110,21 +124,36 @@ Examples:
     # Common options (using common function)
     add_common_args(parser)
 
+    return parser
+
+
+def run(args=None):
+    """Run the datetime synchronizer command."""
+    parser = _build_parser()
+
     parsed_args = parser.parse_args(args)
 
     # Validate post selection arguments (using common function)
     validate_post_selection_args(parsed_args, parser, include_text=False)
 
-    print(f"{'='*60}")
-    print("Hugo Post Datetime Synchronizer")
-    print(f"{'='*60}")
+    print(format_heading("Hugo Post Datetime Synchronizer"))
     if parsed_args.dry_run:
         print("[DRY RUN MODE - No files will be modified]")
     print()
 
     # Load and filter posts
-    synchronizer = DatetimeSynchronizer(parsed_args.content_dir)
-    synchronizer.load_posts()
+    synchronizer = DatetimeSynchronizer(
+        parsed_args.content_dir, make_frontmatter_cache(parsed_args), jobs=parsed_args.jobs
+    )
+    # Explicit --path selections only need those files, not the whole directory
+    try:
+        if parsed_args.path and not parsed_args.all:
+            synchronizer.load_specific_posts(parsed_args.path)
+        else:
+            synchronizer.load_posts()
+    except ContentDirMissing as e:
+        print(f"Error: {e}")
+        return 1
 
     selected_posts = synchronizer.filter_posts(
         select_all=parsed_args.all,
@@ -143,11 +172,12 @@ Examples:
 
     # Synchronize datetimes
     modified_count, skipped_count, error_count = synchronizer.synchronize_datetimes(
-        selected_posts, dry_run=parsed_args.dry_run
+        selected_posts, dry_run=parsed_args.dry_run, quiet=parsed_args.quiet
     )
+    synchronizer.save_cache()
 
     print()
-    print(f"{'='*60}")
+    print(BANNER)
     if parsed_args.dry_run:
         print(f"[DRY RUN] Would update {modified_count} of {len(selected_posts)} posts")
     else:
@@ -159,7 +189,7 @@ Examples:
     if error_count > 0:
         print(f"Errors: {error_count} posts failed to update")
 
-    print(f"{'='*60}")
+    print(BANNER)
 
     return 0 if error_count == 0 else 1
 
@@ -20,15 +20,16 @@ import html
 import os
 import re
 import sys
+import threading
 import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from urllib.parse import unquote
 
-import yaml
-from bs4 import BeautifulSoup
-from markdownify import markdownify as md
+from hugotools.common import BANNER, dump_yaml, format_heading
 
 # WordPress XML namespaces
 NAMESPACES = {
@@ -39,52 +40,129 @@ NAMESPACES = {
     "wp": "http://wordpress.org/export/1.2/",
 }
 
+# Pre-resolved Clark-notation ({uri}name) tag names, so lookups skip the
+# prefix -> namespace mapping on every find
+TAG_CREATOR = f"{{{NAMESPACES['dc']}}}creator"
+TAG_CONTENT = f"{{{NAMESPACES['content']}}}encoded"
+TAG_EXCERPT = f"{{{NAMESPACES['excerpt']}}}encoded"
+TAG_POST_ID = f"{{{NAMESPACES['wp']}}}post_id"
+TAG_POST_DATE = f"{{{NAMESPACES['wp']}}}post_date"
+TAG_POST_DATE_GMT = f"{{{NAMESPACES['wp']}}}post_date_gmt"
+TAG_POST_MODIFIED = f"{{{NAMESPACES['wp']}}}post_modified"
+TAG_POST_NAME = f"{{{NAMESPACES['wp']}}}post_name"
+TAG_STATUS = f"{{{NAMESPACES['wp']}}}status"
+TAG_POST_PARENT = f"{{{NAMESPACES['wp']}}}post_parent"
+TAG_POST_TYPE = f"{{{NAMESPACES['wp']}}}post_type"
+TAG_IS_STICKY = f"{{{NAMESPACES['wp']}}}is_sticky"
+
+# Precompiled patterns used by the conversion pipeline
+_RE_URL_PATH = re.compile(r"https?://[^/]+(/.*)")
+_RE_NUM_ENTITY = re.compile(r"&#(\d+);")
+_RE_HEX_ENTITY = re.compile(r"&#x([0-9a-fA-F]+);")
+_RE_PRE = re.compile(r"<pre[^>]*>(.*?)</pre>", re.DOTALL | re.IGNORECASE)
+_RE_CODE = re.compile(r"<code([^>]*)>(.*?)</code>", re.DOTALL)
+_RE_CLASS = re.compile(r'class=["\']([^"\']*)["\']')
+_RE_CAPTION_OPEN = re.compile(r"\[caption[^\]]*\]")
+_RE_CAPTION_CLOSE = re.compile(r"\[/caption\]")
+_RE_IMG = re.compile(r"""<img\b((?:[^>"']|"[^"]*"|'[^']*')*)>""", re.IGNORECASE)
+_RE_ATTR = re.compile(r"""([\w:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""")
+_RE_FIGURE = re.compile(r"</?figure\b[^>]*>", re.IGNORECASE)
+_RE_CODEBLOCK_PLACEHOLDER = re.compile(r"___CODEBLOCK_(\d+)___")
+_RE_CODEBLOCK_STRIP = re.compile(r"```.*?```", re.DOTALL)
+_RE_STRAY_TAG = re.compile(r"<([a-zA-Z][a-zA-Z0-9]*)[^>]*>")
+_RE_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+_RE_FILENAME_INVALID = re.compile(r"[^\w\s-]")
+_RE_FILENAME_SEPARATORS = re.compile(r"[-\s]+")
+# Whitespace in plain-text posts, normalized the way markdownify does for HTML text
+_RE_PLAIN_WHITESPACE = re.compile(r"(?P<newline>[\t ]*\r?\n[\t ]*)|(?P<space>[\t ]+)")
+
+# Markdown cleanup passes. Each alternation only combines substitutions that
+# cannot interact with each other, so the result is identical to running the
+# individual substitutions one after another.
+_RE_BLANKS_NBSP = re.compile(r"(?P<blank>\n{3,})|(?P<nbsp>&nbsp;)")
+_RE_LINK_OR_SHORTCODE = re.compile(
+    r"(?P<link>\[[^\]]+\]\([^)]+\))|(?P<shortcode>\[/?[\w_-]+[^\]]*\])"
+)
+_RE_FINAL_CLEANUP = re.compile(
+    r"(?P<linkspace>\]\s+\()|(?P<escunder>[a-zA-Z0-9]\\_[a-zA-Z0-9])|(?P<trail> +\n)"
+)
+
+# Number of threads used to write converted posts to disk
+_WRITE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Flags for creating/truncating output files (O_BINARY only exists on Windows)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# <code> classes recognised as a code block language
+_LANG_CLASS_PREFIX = "language-"
+_LANG_CLASSES = frozenset(
+    {"python", "bash", "javascript", "js", "perl", "shell", "sh", "go", "rust", "java", "c", "cpp"}
+)
+
+# Tag names reported by detect_stray_html that are not really HTML
+_STRAY_HTML_EXCLUDED = frozenset({"codeblock", "http", "https", "ftp", "mailto"})
+
 
 class WordPressPost:
     """Represents a WordPress post with all its metadata."""
 
     def __init__(self, item: ET.Element):
-        self.item = item
-        self.title = self._get_text("title")
-        self.link = self._get_text("link")
-        self.pub_date = self._get_text("pubDate")
-        self.creator = self._get_text("dc:creator", NAMESPACES)
-        self.guid = self._get_text("guid")
-        self.description = self._get_text("description")
-        self.content = self._get_text("content:encoded", NAMESPACES)
-        self.excerpt = self._get_text("excerpt:encoded", NAMESPACES)
+        # Fields are extracted eagerly and the element is not retained, so
+        # instances stay picklable and can be shipped to worker processes.
+        self.title = self._get_text(item, "title")
+        self.link = self._get_text(item, "link")
+        self.pub_date = self._get_text(item, "pubDate")
+        self.creator = self._get_text(item, TAG_CREATOR)
+        self.guid = self._get_text(item, "guid")
+        self.description = self._get_text(item, "description")
+        self.content = self._get_text(item, TAG_CONTENT)
+        self.excerpt = self._get_text(item, TAG_EXCERPT)
 
         # WordPress-specific fields
-        self.post_id = self._get_text("wp:post_id", NAMESPACES)
-        self.post_date = self._get_text("wp:post_date", NAMESPACES)
-        self.post_date_gmt = self._get_text("wp:post_date_gmt", NAMESPACES)
-        self.post_modified = self._get_text("wp:post_modified", NAMESPACES)
-        self.post_name = self._get_text("wp:post_name", NAMESPACES)
-        self.status = self._get_text("wp:status", NAMESPACES)
-        self.post_parent = self._get_text("wp:post_parent", NAMESPACES)
-        self.post_type = self._get_text("wp:post_type", NAMESPACES)
-        self.is_sticky = self._get_text("wp:is_sticky", NAMESPACES)
+        self.post_id = self._get_text(item, TAG_POST_ID)
+        self.post_date = self._get_text(item, TAG_POST_DATE)
+        self.post_date_gmt = self._get_text(item, TAG_POST_DATE_GMT)
+        self.post_modified = self._get_text(item, TAG_POST_MODIFIED)
+        self.post_name = self._get_text(item, TAG_POST_NAME)
+        self.status = self._get_text(item, TAG_STATUS)
+        self.post_parent = self._get_text(item, TAG_POST_PARENT)
+        self.post_type = self._get_text(item, TAG_POST_TYPE)
+        self.is_sticky = self._get_text(item, TAG_IS_STICKY)
+        self._post_datetime = self._parse_post_date(self.post_date)
+        self._hugo_url: Optional[str] = None
 
         # Categories and tags
         self.categories = []
         self.tags = []
-        self._parse_taxonomies()
+        self._parse_taxonomies(item)
 
-    def _get_text(self, tag: str, namespaces: Optional[Dict] = None) -> str:
-        """Get text content from XML element."""
-        elem = self.item.find(tag, namespaces or {})
-        return elem.text.strip() if elem is not None and elem.text else ""
+    @staticmethod
+    def _get_text(item: ET.Element, tag: str) -> str:
+        """Get text content from XML element (tag in Clark notation if namespaced)."""
+        return (item.findtext(tag) or "").strip()
 
-    def _parse_taxonomies(self):
+    def _parse_taxonomies(self, item: ET.Element):
         """Extract categories and tags from category elements."""
-        for cat_elem in self.item.findall("category"):
-            domain = cat_elem.get("domain", "")
-            text = cat_elem.text or ""
-
-            if domain == "category" and text:
-                self.categories.append(text)
-            elif domain == "post_tag" and text:
-                self.tags.append(text)
+        add_category = self.categories.append
+        add_tag = self.tags.append
+        for cat_elem in item.iterfind("category"):
+            text = cat_elem.text
+            if not text:
+                continue
+
+            domain = cat_elem.get("domain")
+            if domain == "category":
+                add_category(text)
+            elif domain == "post_tag":
+                add_tag(text)
+
+    @staticmethod
+    def _parse_post_date(post_date: str) -> Optional[datetime]:
+        """Parse WordPress date format: 2019-02-05 23:30:40"""
+        try:
+            return datetime.strptime(post_date, "%Y-%m-%d %H:%M:%S")
+        except (ValueError, TypeError):
+            return None
 
     def should_export(self) -> bool:
         """Check if this post should be exported."""
@@ -104,14 +182,11 @@ class WordPressPost:
 
     def get_hugo_date(self) -> str:
         """Convert WordPress date to Hugo-compatible ISO format."""
-        try:
-            # Parse WordPress date format: 2019-02-05 23:30:40
-            dt = datetime.strptime(self.post_date, "%Y-%m-%d %H:%M:%S")
-            # Return ISO format with timezone
-            return dt.isoformat() + "+00:00"
-        except (ValueError, TypeError):
+        if self._post_datetime is None:
             # Fallback to current time if parsing fails
             return datetime.now().isoformat() + "+00:00"
+        # Return ISO format with timezone
+        return self._post_datetime.isoformat() + "+00:00"
 
     def get_hugo_url(self) -> str:
         """Generate Hugo-compatible URL from post link.
@@ -120,10 +195,16 @@ class WordPressPost:
         the date-based structure (e.g., /2022/12/asterisk-intended/)
         and decoding URL-encoded characters (e.g., %cf%80 -> π)
         """
+        if self._hugo_url is None:
+            self._hugo_url = self._build_hugo_url()
+        return self._hugo_url
+
+    def _build_hugo_url(self) -> str:
+        """Build the URL returned (and memoized) by get_hugo_url."""
         if self.link:
             # Extract path from URL
             # Example: https://blog.bjdean.id.au/2022/12/asterisk-intended/ -> /2022/12/asterisk-intended/
-            match = re.search(r"https?://[^/]+(/.*)", self.link)
+            match = _RE_URL_PATH.search(self.link)
             if match:
                 # Decode URL-encoded characters (e.g., %cf%80 -> π)
                 return unquote(match.group(1))
@@ -135,12 +216,16 @@ class WordPressPost:
 
     def get_timestamp(self) -> Optional[float]:
         """Get Unix timestamp from post date for setting file mtime."""
-        try:
-            # Parse WordPress date format: 2019-02-05 23:30:40
-            dt = datetime.strptime(self.post_date, "%Y-%m-%d %H:%M:%S")
-            return dt.timestamp()
-        except (ValueError, TypeError):
+        if self._post_datetime is None:
             return None
+        return self._post_datetime.timestamp()
+
+    def get_timestamp_ns(self) -> Optional[int]:
+        """Get the post date as integer nanoseconds, as accepted by os.utime(ns=...)."""
+        if self._post_datetime is None:
+            return None
+        # WordPress dates have whole-second precision
+        return int(self._post_datetime.timestamp()) * 1_000_000_000
 
 
 def clean_html_entities(text: str) -> str:
@@ -148,11 +233,14 @@ def clean_html_entities(text: str) -> str:
     # Unescape HTML entities
     text = html.unescape(text)
 
-    # Handle any remaining numeric entities
-    text = re.sub(r"&#(\d+);", lambda m: chr(int(m.group(1))), text)
-    text = re.sub(r"&#x([0-9a-fA-F]+);", lambda m: chr(int(m.group(1), 16)), text)
-
-    return text
+    # Handle any remaining numeric entities (e.g. from double-encoded "&amp;#8217;").
+    # html.unescape has already decoded the rest, so usually there's nothing left.
+    if "&#" not in text:
+        return text
+    text = _RE_NUM_ENTITY.sub(lambda m: chr(int(m.group(1))), text)
+    if "&#x" not in text:
+        return text
+    return _RE_HEX_ENTITY.sub(lambda m: chr(int(m.group(1), 16)), text)
 
 
 def convert_code_blocks(text: str) -> str:
@@ -172,7 +260,7 @@ def convert_code_blocks(text: str) -> str:
         pre_content = match.group(1)
 
         # Check if there's a <code> tag inside
-        code_match = re.search(r"<code([^>]*)>(.*?)</code>", pre_content, re.DOTALL)
+        code_match = _RE_CODE.search(pre_content)
 
         if code_match:
             attrs = code_match.group(1)
@@ -180,26 +268,13 @@ def convert_code_blocks(text: str) -> str:
 
             # Try to detect language from class
             lang = ""
-            class_match = re.search(r'class=["\']([^"\']*)["\']', attrs)
+            class_match = _RE_CLASS.search(attrs)
             if class_match:
                 classes = class_match.group(1).split()
                 for cls in classes:
-                    if cls.startswith("language-"):
-                        lang = cls.replace("language-", "")
-                    elif cls in [
-                        "python",
-                        "bash",
-                        "javascript",
-                        "js",
-                        "perl",
-                        "shell",
-                        "sh",
-                        "go",
-                        "rust",
-                        "java",
-                        "c",
-                        "cpp",
-                    ]:
+                    if cls.startswith(_LANG_CLASS_PREFIX):
+                        lang = cls[len(_LANG_CLASS_PREFIX) :]
+                    elif cls in _LANG_CLASSES:
                         lang = cls
         else:
             code_content = pre_content
@@ -216,59 +291,52 @@ def convert_code_blocks(text: str) -> str:
         return f"___CODEBLOCK_{len(code_blocks)-1}___"
 
     # Replace all <pre>...</pre> blocks with placeholders
-    text = re.sub(
-        r"<pre[^>]*>(.*?)</pre>", replace_pre_block, text, flags=re.DOTALL | re.IGNORECASE
-    )
+    text = _RE_PRE.sub(replace_pre_block, text)
 
     return text, code_blocks
 
 
+def _img_to_markdown(match: re.Match) -> str:
+    """Replace a single <img> tag with its markdown equivalent."""
+    attrs = {}
+    # A repeated attribute keeps its last value, as it did with BeautifulSoup's html.parser
+    for name, double, single, bare in _RE_ATTR.findall(match.group(1)):
+        attrs[name.lower()] = double or single or bare
+    return f"![{attrs.get('alt', '')}]({attrs.get('src', '')})"
+
+
 def convert_images(text: str) -> str:
     """Convert HTML image tags and WordPress caption shortcodes to Markdown."""
-    soup = BeautifulSoup(text, "html.parser")
-
     # Handle WordPress caption shortcodes before processing HTML
     # Pattern: [caption ...]<img>...[/caption]
-    text_str = str(soup)
-    # Remove [caption ...] opening tags
-    text_str = re.sub(r"\[caption[^\]]*\]", "", text_str)
-    # Remove [/caption] closing tags
-    text_str = re.sub(r"\[/caption\]", "", text_str)
-    soup = BeautifulSoup(text_str, "html.parser")
-
-    for img in soup.find_all("img"):
-        src = img.get("src", "")
-        alt = img.get("alt", "")
-
-        # Remove loading="lazy" and other WordPress-specific attributes
-        # For srcset (responsive images), just use the src for now
+    text = _RE_CAPTION_OPEN.sub("", text)
+    text = _RE_CAPTION_CLOSE.sub("", text)
 
-        # Convert to markdown
-        md_img = f"![{alt}]({src})"
-        img.replace_with(md_img)
+    # Convert to markdown, dropping loading="lazy", srcset and other
+    # WordPress-specific attributes (for responsive images just use the src)
+    text = _RE_IMG.sub(_img_to_markdown, text)
 
     # Remove figure wrappers
-    for figure in soup.find_all("figure"):
-        # Extract content and unwrap
-        figure.unwrap()
-
-    return str(soup)
+    return _RE_FIGURE.sub("", text)
 
 
 def detect_stray_html(text: str) -> List[str]:
     """Detect any remaining HTML tags in the content."""
+    # Most converted posts contain no tags at all
+    if "<" not in text:
+        return []
+
     # Split content into code blocks and regular content
     # Remove everything between ``` markers (code blocks)
-    text_without_code = re.sub(r"```.*?```", "", text, flags=re.DOTALL)
+    text_without_code = _RE_CODEBLOCK_STRIP.sub("", text)
 
     # Find all HTML-like tags outside code blocks
-    tags = re.findall(r"<([a-zA-Z][a-zA-Z0-9]*)[^>]*>", text_without_code)
+    tags = _RE_STRAY_TAG.findall(text_without_code)
 
     # Filter out common false positives and valid markdown/HTML-like patterns
     # - Single letters/numbers (likely from code or special syntax)
     # - Protocol handlers (http, https, ftp, etc.)
-    excluded_patterns = {"codeblock", "http", "https", "ftp", "mailto"}
-    tags = [tag for tag in tags if tag.lower() not in excluded_patterns and not tag.isdigit()]
+    tags = [tag for tag in tags if tag.lower() not in _STRAY_HTML_EXCLUDED and not tag.isdigit()]
 
     # Also filter out single character tags
     tags = [tag for tag in tags if len(tag) > 1]
@@ -294,6 +362,9 @@ def create_hugo_frontmatter(post: WordPressPost) -> Dict:
 
     # Add excerpt if present
     if post.excerpt:
+        # Imported here rather than at module level to keep CLI startup fast
+        from bs4 import BeautifulSoup
+
         excerpt_clean = clean_html_entities(post.excerpt)
         excerpt_clean = BeautifulSoup(excerpt_clean, "html.parser").get_text()
         frontmatter["description"] = excerpt_clean.strip()
@@ -301,18 +372,56 @@ def create_hugo_frontmatter(post: WordPressPost) -> Dict:
     return frontmatter
 
 
-def convert_post(post: WordPressPost) -> str:
-    """Convert a WordPress post to Hugo markdown format."""
-    # Create frontmatter
-    frontmatter = create_hugo_frontmatter(post)
+@lru_cache(maxsize=None)
+def _markdown_converter():
+    """Get the shared markdownify converter, configured once per process."""
+    # Imported here rather than at module level to keep CLI startup fast
+    from markdownify import MarkdownConverter
+
+    return MarkdownConverter(
+        heading_style="ATX",
+        bullets="-",
+        strong_em_symbol="*",
+        escape_asterisks=False,
+        escape_underscores=False,
+    )
+
+
+def _restore_code_block(match: re.Match, code_blocks: List[str]) -> str:
+    index = int(match.group(1))
+    return code_blocks[index] if index < len(code_blocks) else match.group(0)
+
+
+def _blanks_nbsp_sub(match: re.Match) -> str:
+    return "\n\n" if match.lastgroup == "blank" else " "
+
 
+def _plain_whitespace_sub(match: re.Match) -> str:
+    return "\n" if match.lastgroup == "newline" else " "
+
+
+def _link_or_shortcode_sub(match: re.Match) -> str:
+    return match.group(0) if match.lastgroup == "link" else ""
+
+
+def _final_cleanup_sub(match: re.Match) -> str:
+    kind = match.lastgroup
+    if kind == "linkspace":
+        return "]("
+    if kind == "escunder":
+        text = match.group(0)
+        return f"{text[0]}_{text[-1]}"
+    return "\n"
+
+
+def _convert_html_content(content: str) -> str:
+    """Convert WordPress HTML post content to markdown (before the final cleanup)."""
     # Clean content - NOTE THE ORDER IS CRITICAL:
     # 1. First extract and convert code blocks (while entities are still &lt; etc)
     #    This replaces them with placeholders
     # 2. Then clean entities in the rest of the content
     # 3. Then do general markdown conversion (won't affect placeholders)
     # 4. Finally restore the code blocks
-    content = post.content
 
     # Step 1: Extract and convert code blocks (returns text with placeholders and list of blocks)
     content, code_blocks = convert_code_blocks(content)
@@ -325,83 +434,82 @@ def convert_post(post: WordPressPost) -> str:
 
     # Use markdownify for general HTML to Markdown conversion
     # This will handle &lt; and &gt; entities properly
-    content = md(
-        content,
-        heading_style="ATX",
-        bullets="-",
-        strong_em_symbol="*",
-        escape_asterisks=False,
-        escape_underscores=False,
-    )
+    content = _markdown_converter().convert(content)
 
     # NOW clean remaining HTML entities (after markdownify won't be confused by them)
     content = clean_html_entities(content)
 
     # Step 4: Restore code blocks from placeholders
-    for i, code_block in enumerate(code_blocks):
-        content = content.replace(f"___CODEBLOCK_{i}___", code_block)
-
-    # Clean up excessive whitespace
-    content = re.sub(r"\n{3,}", "\n\n", content)
-
-    # Clean up &nbsp; that might remain
-    content = content.replace("&nbsp;", " ")
-
-    # Remove WordPress shortcodes
-    protected_links = []
+    content = _RE_CODEBLOCK_PLACEHOLDER.sub(lambda m: _restore_code_block(m, code_blocks), content)
 
-    def protect_link(match):
-        protected_links.append(match.group(0))
-        return f"___LINK_{len(protected_links)-1}___"
+    # Collapse excessive blank lines and replace any remaining &nbsp;
+    content = _RE_BLANKS_NBSP.sub(_blanks_nbsp_sub, content)
 
-    content = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", protect_link, content)
-    content = re.sub(r"\[/?[\w_-]+[^\]]*\]", "", content)
-
-    for i, link in enumerate(protected_links):
-        content = content.replace(f"___LINK_{i}___", link)
+    # Remove WordPress shortcodes, leaving markdown links untouched
+    content = _RE_LINK_OR_SHORTCODE.sub(_link_or_shortcode_sub, content)
 
     # Clean up any remaining HTML comments
-    content = re.sub(r"<!--.*?-->", "", content, flags=re.DOTALL)
+    return _RE_COMMENT.sub("", content)
 
-    # Fix markdown links that got mangled
-    content = re.sub(r"\]\s+\(", "](", content)
 
-    # Remove extra escaping of underscores
-    content = re.sub(r"([a-zA-Z0-9])\\_([a-zA-Z0-9])", r"\1_\2", content)
+def convert_post(post: WordPressPost) -> str:
+    """Convert a WordPress post to Hugo markdown format."""
+    # Create frontmatter
+    frontmatter = create_hugo_frontmatter(post)
+
+    content = post.content
+    if "<" in content or "[" in content:
+        content = _convert_html_content(content)
+    else:
+        # Plain text with no HTML tags or shortcodes (paragraphs are just blank
+        # lines) only needs whitespace normalizing, entities decoding and blank lines
+        # collapsing. Tabs and runs of spaces become single spaces as markdownify
+        # would make them, but unlike markdownify the paragraph breaks are kept.
+        content = _RE_PLAIN_WHITESPACE.sub(_plain_whitespace_sub, content)
+        content = clean_html_entities(content)
+        content = _RE_BLANKS_NBSP.sub(_blanks_nbsp_sub, content)
 
-    # Final cleanup
-    content = re.sub(r" +\n", "\n", content)
+    # Fix mangled links, unescape underscores and strip trailing spaces
+    content = _RE_FINAL_CLEANUP.sub(_final_cleanup_sub, content)
 
     content = content.strip()
 
     # Build the markdown file
-    output = "---\n"
-    output += yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True, sort_keys=False)
-    output += "---\n\n"
-    output += content
-
-    return output
+    return "".join(("---\n", dump_yaml(frontmatter), "---\n\n", content))
 
 
 def parse_wordpress_xml(xml_path: Path) -> List[WordPressPost]:
-    """Parse WordPress XML export and extract posts."""
-    print(f"Parsing WordPress XML export: {xml_path}")
-
-    # Parse XML
-    tree = ET.parse(xml_path)
-    root = tree.getroot()
+    """Parse WordPress XML export and extract posts.
 
-    # Find all items
-    items = root.findall(".//item")
-    print(f"Found {len(items)} items in export")
+    The export is streamed with iterparse: each <item> is converted to a
+    WordPressPost as soon as it has been read and then detached from the
+    tree, so memory use stays flat regardless of export size.
+    """
+    print(f"Parsing WordPress XML export: {xml_path}")
 
-    # Convert to WordPressPost objects
     posts = []
-    for item in items:
-        post = WordPressPost(item)
+    item_count = 0
+    parents = []
+    for event, elem in ET.iterparse(xml_path, events=("start", "end")):
+        if event == "start":
+            parents.append(elem)
+            continue
+
+        parents.pop()
+        if elem.tag != "item":
+            continue
+
+        item_count += 1
+        post = WordPressPost(elem)
         if post.should_export():
             posts.append(post)
 
+        # Free the item - all fields have been copied into the post
+        elem.clear()
+        if parents:
+            parents[-1].remove(elem)
+
+    print(f"Found {item_count} items in export")
     print(f"Found {len(posts)} publishable posts")
     return posts
 
@@ -414,8 +522,8 @@ def generate_filename(post: WordPressPost) -> str:
     else:
         # Fallback to sanitized title
         filename = post.title.lower()
-        filename = re.sub(r"[^\w\s-]", "", filename)
-        filename = re.sub(r"[-\s]+", "-", filename)
+        filename = _RE_FILENAME_INVALID.sub("", filename)
+        filename = _RE_FILENAME_SEPARATORS.sub("-", filename)
 
     # Ensure .md extension
     if not filename.endswith(".md"):
@@ -424,8 +532,58 @@ def generate_filename(post: WordPressPost) -> str:
     return filename
 
 
-def run(args=None):
-    """Run the WordPress import command."""
+def _convert_one(post: WordPressPost) -> Tuple[str, str, List[str], Optional[str]]:
+    """Convert a single post; runs in a worker process.
+
+    Returns a tuple of (filename, markdown, stray_tags, error). Exceptions are
+    returned rather than raised so a single bad post doesn't stop the pool
+    from yielding the remaining results.
+    """
+    try:
+        filename = generate_filename(post)
+        markdown = convert_post(post)
+        return filename, markdown, detect_stray_html(markdown), None
+    except Exception as e:
+        return "", "", [], str(e)
+
+
+def convert_posts(
+    posts: List[WordPressPost], jobs: Optional[int] = None
+) -> Iterator[Tuple[str, str, List[str], Optional[str]]]:
+    """Convert posts in parallel, yielding results in the original post order.
+
+    Args:
+        posts: Posts to convert
+        jobs: Number of worker processes (default: number of CPUs). With a
+            single job (or a single post) conversion runs in-process.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(posts) <= 1:
+        yield from map(_convert_one, posts)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(_convert_one, posts, chunksize=8)
+
+
+def _write_post(output_path: Path, markdown: str, timestamp_ns: Optional[int]):
+    """Write a converted post and set its modification time to the post date."""
+    # Encode once and write the raw bytes; this skips the text-mode file wrapper
+    # (and any newline translation, so files always use \n line endings)
+    data = memoryview(markdown.encode("utf-8"))
+    fd = os.open(output_path, _WRITE_FLAGS, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
+    if timestamp_ns is not None:
+        os.utime(output_path, ns=(timestamp_ns, timestamp_ns))
+
+
+@lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the import command's argument parser, once per process."""
     parser = argparse.ArgumentParser(
         prog="hugotools import", description="Convert WordPress XML export to Hugo markdown posts"
     )
@@ -440,6 +598,19 @@ def run(args=None):
         "--dry-run", action="store_true", help="Show what would be done without writing files"
     )
     parser.add_argument("--limit", type=int, help="Limit number of posts to convert (for testing)")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        metavar="N",
+        help="Number of worker processes used for conversion (default: number of CPUs)",
+    )
+
+    return parser
+
+
+def run(args=None):
+    """Run the WordPress import command."""
+    parser = _build_parser()
 
     parsed_args = parser.parse_args(args)
 
@@ -480,73 +651,94 @@ def run(args=None):
         parsed_args.output_dir.mkdir(parents=True, exist_ok=True)
         print(f"Output directory: {parsed_args.output_dir}")
 
-    print(f"\n{'='*60}")
-    print(f"Converting {len(posts)} posts...")
-    print(f"{'='*60}\n")
-
-    # Convert each post
-    for i, post in enumerate(posts, 1):
-        try:
-            filename = generate_filename(post)
-            output_path = parsed_args.output_dir / filename
-
-            # Convert post
-            markdown = convert_post(post)
-
-            # Check for stray HTML tags
-            stray_tags = detect_stray_html(markdown)
-            if stray_tags:
-                files_with_stray_html.append(
-                    {"filename": filename, "title": post.title, "tags": stray_tags}
-                )
-
-            # Progress indicator
-            print(f"[{i}/{len(posts)}] {post.title}")
-            print(f"  -> {filename}")
-            print(f"  Categories: {', '.join(post.categories) if post.categories else 'None'}")
-            print(f"  Tags: {', '.join(post.tags) if post.tags else 'None'}")
-            print(f"  Date: {post.post_date}")
-            if stray_tags:
-                print(f"  WARNING: Contains HTML tags: {', '.join(stray_tags)}")
-
-            if parsed_args.dry_run:
-                print(f"  [DRY RUN] Would write to: {output_path}")
-                print("  Content preview (first 200 chars):")
-                preview = markdown[:200].replace("\n", " ")
-                print(f"    {preview}...")
+    print()
+    print(format_heading(f"Converting {len(posts)} posts..."))
+    print()
+
+    # Convert posts in worker processes. Writes are I/O-bound and go to a thread
+    # pool as results arrive; the semaphore caps how many are queued at once.
+    results = convert_posts(posts, jobs=parsed_args.jobs)
+    write_slots = threading.BoundedSemaphore(_WRITE_WORKERS * 2)
+    writes = {}
+    # Latest write queued for each output path. Posts that share a filename are written
+    # in order, so the later post wins as it would when writing one at a time.
+    last_writes = {}
+    with ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as writer:
+        for i, (post, (filename, markdown, stray_tags, error)) in enumerate(zip(posts, results), 1):
+            if error is not None:
+                print(f"[{i}/{len(posts)}] {post.title}")
+                print(f"  ERROR: {error}", file=sys.stderr)
+                stats["error"] += 1
+                print()
+                continue
+
+            try:
+                output_path = parsed_args.output_dir / filename
+
+                # Check for stray HTML tags
+                if stray_tags:
+                    files_with_stray_html.append(
+                        {"filename": filename, "title": post.title, "tags": stray_tags}
+                    )
+
+                # Progress indicator, written in one go rather than a print per line
+                lines = [
+                    f"[{i}/{len(posts)}] {post.title}",
+                    f"  -> {filename}",
+                    f"  Categories: {', '.join(post.categories) if post.categories else 'None'}",
+                    f"  Tags: {', '.join(post.tags) if post.tags else 'None'}",
+                    f"  Date: {post.post_date}",
+                ]
+                if stray_tags:
+                    lines.append(f"  WARNING: Contains HTML tags: {', '.join(stray_tags)}")
+
+                if parsed_args.dry_run:
+                    preview = markdown[:200].replace("\n", " ")
+                    lines.append(f"  [DRY RUN] Would write to: {output_path}")
+                    lines.append("  Content preview (first 200 chars):")
+                    lines.append(f"    {preview}...")
+                    stats["success"] += 1
+                else:
+                    previous = last_writes.get(output_path)
+                    if previous is not None:
+                        wait([previous])
+                    write_slots.acquire()
+                    future = writer.submit(
+                        _write_post, output_path, markdown, post.get_timestamp_ns()
+                    )
+                    future.add_done_callback(lambda _: write_slots.release())
+                    writes[future] = output_path
+                    last_writes[output_path] = future
+                    lines.append(f"  Written to: {output_path}")
+
+                sys.stdout.write("\n".join(lines) + "\n\n")
+
+            except Exception as e:
+                print(f"  ERROR: {e}", file=sys.stderr)
+                stats["error"] += 1
+                print()
+
+        # Posts only count as converted once they are on disk
+        for future in as_completed(writes):
+            try:
+                future.result()
+            except Exception as e:
+                print(f"ERROR: Failed to write {writes[future]}: {e}", file=sys.stderr)
+                stats["error"] += 1
             else:
-                # Write file
-                output_path.write_text(markdown, encoding="utf-8")
-
-                # Set file modification time to match post date
-                timestamp = post.get_timestamp()
-                if timestamp:
-                    os.utime(output_path, (timestamp, timestamp))
-
-                print(f"  Written to: {output_path}")
-
-            stats["success"] += 1
-            print()
-
-        except Exception as e:
-            print(f"  ERROR: {e}", file=sys.stderr)
-            stats["error"] += 1
-            print()
+                stats["success"] += 1
 
     # Print summary
-    print(f"{'='*60}")
-    print("CONVERSION SUMMARY")
-    print(f"{'='*60}")
+    print(format_heading("CONVERSION SUMMARY"))
     print(f"Total posts:            {stats['total']}")
     print(f"Successfully converted: {stats['success']}")
     print(f"Errors:                 {stats['error']}")
-    print(f"{'='*60}")
+    print(BANNER)
 
     # Report files with stray HTML
     if files_with_stray_html:
-        print(f"\n{'='*60}")
-        print("FILES REQUIRING MANUAL REVIEW")
-        print(f"{'='*60}")
+        print()
+        print(format_heading("FILES REQUIRING MANUAL REVIEW"))
         print(
             f"\nThe following {len(files_with_stray_html)} file(s) contain HTML tags that may need manual cleanup:\n"
         )
@@ -555,7 +747,7 @@ def run(args=None):
             print(f"    Title: {file_info['title']}")
             print(f"    HTML tags found: {', '.join(sorted(file_info['tags']))}")
             print()
-        print(f"{'='*60}")
+        print(BANNER)
 
     if parsed_args.dry_run:
         print("\nThis was a DRY RUN. Run without --dry-run to write files.")
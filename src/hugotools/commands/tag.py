@@ -7,80 +7,125 @@ Manages tags and categories in Hugo markdown post files.
 
 import argparse
 import sys
-from typing import List, Optional, Set
+from collections import Counter
+from functools import lru_cache
+from typing import AbstractSet, FrozenSet, Iterable, List, Optional
 
 from hugotools.common import (
+    BANNER,
+    ContentDirMissing,
     HugoPost,
     HugoPostManager,
     add_common_args,
     add_post_selection_args,
+    format_heading,
+    make_frontmatter_cache,
     validate_post_selection_args,
 )
 
+# Common Hugo fields whose type is known when used as a --copy/--move source
+KNOWN_LIST_FIELDS = frozenset({"tags", "categories", "keywords", "authors", "series"})
+KNOWN_LABEL_FIELDS = frozenset({"author", "title", "date", "draft", "status"})
+
+# Number of most-used values listed in the --dump summary
+DUMP_TOP_VALUES = 20
+
+
+def _write_report(lines: List[str]):
+    """Write report lines to stdout in a single call."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def split_items(value: Optional[str]) -> FrozenSet[str]:
+    """Split a comma-separated option value into a set of stripped, non-empty items.
+
+    Items are interned, as they are hashed and compared against every selected post.
+    """
+    if not value:
+        return frozenset()
+    return frozenset(sys.intern(item) for item in map(str.strip, value.split(",")) if item)
+
 
 class HugoTagManager(HugoPostManager):
     """Manages tags and categories in Hugo posts."""
 
     def modify_metadata(
         self,
-        posts: List[HugoPost],
+        posts: Iterable[HugoPost],
         field: str,
-        add_items: Set[str],
-        remove_items: Set[str],
+        add_items: AbstractSet[str],
+        remove_items: AbstractSet[str],
         dry_run: bool = False,
+        quiet: bool = False,
     ):
         """Add or remove tags/categories from posts."""
 
         modified_count = 0
+        if not add_items and not remove_items:
+            return modified_count
+        to_save = []
+        # Per-post reports are written together once the loop finishes
+        report = []
+        status = "[DRY RUN] " if dry_run else ""
 
         for post in posts:
-            current_items = set(post.get_metadata_list(field))
-            original_items = current_items.copy()
-
-            # Add items
-            if add_items:
-                current_items.update(add_items)
-
-            # Remove items
-            if remove_items:
-                current_items.difference_update(remove_items)
-
-            # Check if anything changed
-            if current_items != original_items:
-                modified_count += 1
-
-                # Show what's changing
-                added = current_items - original_items
-                removed = original_items - current_items
-
+            # Posts without the field have nothing to remove (custom fields are often absent)
+            if not add_items and not post.has_field(field):
+                continue
+            items = post.get_metadata_list(field)
+
+            # Work out the changes against the (usually short) list directly; removals win
+            # over additions. The post's own set is only built once we know it changes.
+            added = add_items.difference(items, remove_items)
+            removed = remove_items.intersection(items)
+
+            # Nothing changed, which is the common case for bulk operations
+            if not added and not removed:
+                continue
+
+            modified_count += 1
+            original_items = set(items)
+            # Sorted once here and used for both the report and the saved value
+            new_sorted = sorted((original_items | added) - removed)
+
+            # Show what's changing
+            if not quiet:
                 changes = []
                 if added:
                     changes.append(f"+{sorted(added)}")
                 if removed:
                     changes.append(f"-{sorted(removed)}")
 
-                status = "[DRY RUN] " if dry_run else ""
-                print(f"{status}Modifying {post.file_path.name}: {' '.join(changes)}")
-                print(f"  {field}: {sorted(original_items)} -> {sorted(current_items)}")
+                report.append(
+                    f"{status}Modifying {post.file_name}: {' '.join(changes)}\n"
+                    f"  {field}: {sorted(original_items)} -> {new_sorted}"
+                )
 
-                # Save if not dry run
-                if not dry_run:
-                    post.set_metadata_list(field, sorted(current_items))
-                    post.save()
+            # Queue for saving if not dry run
+            if not dry_run:
+                post.set_metadata_list(field, new_sorted)
+                to_save.append(post)
 
+        _write_report(report)
+        self.save_posts(to_save)
         return modified_count
 
     def modify_label(
         self,
-        posts: List[HugoPost],
+        posts: Iterable[HugoPost],
         field: str,
         set_value: Optional[str],
         remove: bool = False,
         dry_run: bool = False,
+        quiet: bool = False,
     ):
         """Set or remove a single-value label field in posts."""
 
         modified_count = 0
+        to_save = []
+        report = []
+        status = "[DRY RUN] " if dry_run else ""
 
         for post in posts:
             current_value = post.get_metadata_label(field)
@@ -98,64 +143,62 @@ class HugoTagManager(HugoPostManager):
                 modified_count += 1
 
                 # Show what's changing
-                status = "[DRY RUN] " if dry_run else ""
-                print(f"{status}Modifying {post.file_path.name}")
-                if new_value is None:
-                    print(f"  {field}: '{current_value}' -> (removed)")
-                else:
-                    print(f"  {field}: '{current_value}' -> '{new_value}'")
+                if not quiet:
+                    report.append(f"{status}Modifying {post.file_name}")
+                    if new_value is None:
+                        report.append(f"  {field}: '{current_value}' -> (removed)")
+                    else:
+                        report.append(f"  {field}: '{current_value}' -> '{new_value}'")
 
-                # Save if not dry run
+                # Queue for saving if not dry run
                 if not dry_run:
                     post.set_metadata_label(field, new_value)
-                    post.save()
+                    to_save.append(post)
 
+        _write_report(report)
+        self.save_posts(to_save)
         return modified_count
 
     def dump_metadata(self, posts: List[HugoPost], field: str, field_type: str):
         """Dump metadata field values from posts."""
 
-        print(f"{'='*60}")
-        print(f"Dumping '{field}' from {len(posts)} posts")
-        print(f"{'='*60}\n")
+        # Collect the whole report and write it at once rather than line by line
+        lines = [format_heading(f"Dumping '{field}' from {len(posts)} posts"), ""]
+        append = lines.append
+        # Counting uses also de-duplicates, so one pass gives both summary lines
+        all_values = Counter()
 
         if field_type == "list":
             # For list fields, show all items
-            all_values = set()
             for post in posts:
                 items = post.get_metadata_list(field)
                 if items:
-                    print(f"{post.file_path.name}:")
-                    print(f"  {field}: {items}")
+                    append(f"{post.file_name}:\n  {field}: {items}")
                     all_values.update(items)
                 else:
-                    print(f"{post.file_path.name}:")
-                    print(f"  {field}: (not found or empty)")
-
-            print(f"\n{'='*60}")
-            print(f"Summary: {len(all_values)} unique values")
-            if all_values:
-                print(f"All values: {sorted(all_values)}")
-            print(f"{'='*60}")
+                    append(f"{post.file_name}:\n  {field}: (not found or empty)")
 
         else:  # label field
             # For label fields, show single value
-            all_values = set()
             for post in posts:
                 value = post.get_metadata_label(field)
                 if value is not None:
-                    print(f"{post.file_path.name}:")
-                    print(f"  {field}: '{value}'")
-                    all_values.add(value)
+                    append(f"{post.file_name}:\n  {field}: '{value}'")
+                    all_values[value] += 1
                 else:
-                    print(f"{post.file_path.name}:")
-                    print(f"  {field}: (not found)")
+                    append(f"{post.file_name}:\n  {field}: (not found)")
+
+        append("")
+        append(BANNER)
+        append(f"Summary: {len(all_values)} unique values")
+        if all_values:
+            append(f"All values: {sorted(all_values)}")
+            top = all_values.most_common(DUMP_TOP_VALUES)
+            append("Most used: " + ", ".join(f"{value} ({count})" for value, count in top))
+        append(BANNER)
+        append("")
 
-            print(f"\n{'='*60}")
-            print(f"Summary: {len(all_values)} unique values")
-            if all_values:
-                print(f"All values: {sorted(all_values)}")
-            print(f"{'='*60}")
+        sys.stdout.write("\n".join(lines))
 
     def copy_or_move_metadata(
         self,
@@ -166,6 +209,7 @@ class HugoTagManager(HugoPostManager):
         dest_type: str,
         move: bool = False,
         dry_run: bool = False,
+        quiet: bool = False,
     ):
         """Copy or move metadata from one field to another.
 
@@ -177,6 +221,7 @@ class HugoTagManager(HugoPostManager):
             dest_type: Destination field type ('list' or 'label')
             move: If True, remove from source after copying; if False, just copy
             dry_run: If True, don't actually modify files
+            quiet: If True, don't print the changes made to each post
 
         Raises:
             ValueError: If source_type and dest_type don't match
@@ -192,50 +237,48 @@ class HugoTagManager(HugoPostManager):
             )
 
         modified_count = 0
+        to_save = []
+        report = []
+        status = "[DRY RUN] " if dry_run else ""
+        operation = "Moving" if move else "Copying"
 
         for post in posts:
+            if not post.has_field(source_field):
+                continue  # Nothing to copy/move
+
             if source_type == "list":
                 # Handle list fields
                 source_items = set(post.get_metadata_list(source_field))
-                dest_items = set(post.get_metadata_list(dest_field))
-
                 if not source_items:
                     continue  # Nothing to copy/move
+                dest_items = set(post.get_metadata_list(dest_field))
 
-                original_dest = dest_items.copy()
-                original_source = source_items.copy()
-
-                # Copy items to destination
-                dest_items.update(source_items)
-
-                # If moving, clear source
-                if move:
-                    source_items.clear()
-
-                # Check if anything changed
-                dest_changed = dest_items != original_dest
-                source_changed = source_items != original_source
-
-                if dest_changed or source_changed:
-                    modified_count += 1
+                # Moving always empties the source; a copy only changes the post when
+                # the destination is missing some of the source items
+                if not move and source_items <= dest_items:
+                    continue
 
-                    # Show what's changing
-                    status = "[DRY RUN] " if dry_run else ""
-                    operation = "Moving" if move else "Copying"
-                    print(f"{status}{operation} in {post.file_path.name}")
-                    print(f"  {source_field}: {sorted(original_source)} -> {sorted(source_items)}")
-                    print(f"  {dest_field}: {sorted(original_dest)} -> {sorted(dest_items)}")
+                modified_count += 1
+                # Sorted once and used for both the report and the saved values
+                source_sorted = sorted(source_items)
+                new_source = [] if move else source_sorted
+                new_dest = sorted(dest_items | source_items)
 
-                    # Save if not dry run
-                    if not dry_run:
-                        post.set_metadata_list(dest_field, sorted(dest_items))
-                        if move:
-                            if source_items:
-                                post.set_metadata_list(source_field, sorted(source_items))
-                            else:
-                                # Remove the field entirely if empty after move
-                                post.set_metadata_list(source_field, [])
-                        post.save()
+                # Show what's changing
+                if not quiet:
+                    report.append(
+                        f"{status}{operation} in {post.file_name}\n"
+                        f"  {source_field}: {source_sorted} -> {new_source}\n"
+                        f"  {dest_field}: {sorted(dest_items)} -> {new_dest}"
+                    )
+
+                # Queue for saving if not dry run
+                if not dry_run:
+                    post.set_metadata_list(dest_field, new_dest)
+                    if move:
+                        # Remove the field entirely now that it is empty
+                        post.set_metadata_list(source_field, [])
+                    to_save.append(post)
 
             else:  # label field
                 # Handle label fields
@@ -257,32 +300,27 @@ class HugoTagManager(HugoPostManager):
                     modified_count += 1
 
                     # Show what's changing
-                    status = "[DRY RUN] " if dry_run else ""
-                    operation = "Moving" if move else "Copying"
-                    print(f"{status}{operation} in {post.file_path.name}")
-                    if move:
-                        print(f"  {source_field}: '{source_value}' -> (removed)")
-                    else:
-                        print(f"  {source_field}: '{source_value}' (unchanged)")
-                    print(f"  {dest_field}: '{dest_value}' -> '{new_dest_value}'")
+                    if not quiet:
+                        report.append(f"{status}{operation} in {post.file_name}")
+                        if move:
+                            report.append(f"  {source_field}: '{source_value}' -> (removed)")
+                        else:
+                            report.append(f"  {source_field}: '{source_value}' (unchanged)")
+                        report.append(f"  {dest_field}: '{dest_value}' -> '{new_dest_value}'")
 
-                    # Save if not dry run
+                    # Queue for saving if not dry run
                     if not dry_run:
                         post.set_metadata_label(dest_field, new_dest_value)
                         if move:
                             post.set_metadata_label(source_field, None)
-                        post.save()
+                        to_save.append(post)
 
+        _write_report(report)
+        self.save_posts(to_save)
         return modified_count
 
 
-def run(args=None):
-    """Run the tag manager command."""
-    parser = argparse.ArgumentParser(
-        prog="hugotools tag",
-        description="Manage tags and categories in Hugo posts",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+EPILOG = """
 Examples:
   # Add 'python' tag to all posts
   hugotools tag --all --add python
@@ -334,7 +372,17 @@ Examples:
 
   # Move label field to another label field
   hugotools tag --all --move author --custom-label editor
-        """,
+        """
+
+
+@lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the tag command's argument parser, once per process."""
+    parser = argparse.ArgumentParser(
+        prog="hugotools tag",
+        description="Manage tags and categories in Hugo posts",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=EPILOG,
     )
 
     # Field selection
@@ -400,6 +448,13 @@ Examples:
     # Common options (using common function)
     add_common_args(parser)
 
+    return parser
+
+
+def run(args=None):
+    """Run the tag manager command."""
+    parser = _build_parser()
+
     parsed_args = parser.parse_args(args)
 
     # Validate post selection arguments (using common function)
@@ -426,27 +481,25 @@ Examples:
     # Validate operations based on field type
     if parsed_args.dump:
         # In dump mode, we don't need other operations
-        if any(
-            [
-                parsed_args.add,
-                parsed_args.remove,
-                parsed_args.set,
-                parsed_args.copy,
-                parsed_args.move,
-            ]
+        if (
+            parsed_args.add
+            or parsed_args.remove
+            or parsed_args.set
+            or parsed_args.copy
+            or parsed_args.move
         ):
             parser.error("Cannot use --dump with --add, --remove, --set, --copy, or --move")
     elif parsed_args.copy or parsed_args.move:
         # Copy/move mode - validate
         if parsed_args.copy and parsed_args.move:
             parser.error("Cannot use both --copy and --move at the same time")
-        if any([parsed_args.add, parsed_args.remove, parsed_args.set]):
+        if parsed_args.add or parsed_args.remove or parsed_args.set:
             parser.error("Cannot use --copy or --move with --add, --remove, or --set")
     else:
         # Not in dump or copy/move mode, require modification operations
         if field_type == "label":
             # For labels, we need either --set or --remove
-            if not any([parsed_args.set, parsed_args.remove]):
+            if not (parsed_args.set or parsed_args.remove):
                 parser.error(
                     "For label fields, at least one operation is required (--set or --remove)"
                 )
@@ -454,21 +507,29 @@ Examples:
                 parser.error("Cannot use --add with label fields. Use --set instead.")
         else:
             # For lists, we need --add or --remove (but not --set)
-            if not any([parsed_args.add, parsed_args.remove]):
+            if not (parsed_args.add or parsed_args.remove):
                 parser.error("At least one operation is required (--add or --remove)")
             if parsed_args.set:
                 parser.error("Cannot use --set with list fields. Use --add instead.")
 
-    print(f"{'='*60}")
-    print(f"Hugo {field.capitalize()} Manager")
-    print(f"{'='*60}")
+    print(format_heading(f"Hugo {field.capitalize()} Manager"))
     if parsed_args.dry_run:
         print("[DRY RUN MODE - No files will be modified]")
     print()
 
     # Load and filter posts
-    manager = HugoTagManager(parsed_args.content_dir)
-    manager.load_posts()
+    manager = HugoTagManager(
+        parsed_args.content_dir, make_frontmatter_cache(parsed_args), jobs=parsed_args.jobs
+    )
+    # Explicit --path selections only need those files, not the whole directory
+    try:
+        if parsed_args.path and not parsed_args.all:
+            manager.load_specific_posts(parsed_args.path)
+        else:
+            manager.load_posts()
+    except ContentDirMissing as e:
+        print(f"Error: {e}")
+        return 1
 
     selected_posts = manager.filter_posts(
         select_all=parsed_args.all,
@@ -500,12 +561,9 @@ Examples:
         # Determine source field type
         # We need to infer the type based on common Hugo fields
         # or assume it's the same type as the destination
-        known_list_fields = ["tags", "categories", "keywords", "authors", "series"]
-        known_label_fields = ["author", "title", "date", "draft", "status"]
-
-        if source_field in known_list_fields:
+        if source_field in KNOWN_LIST_FIELDS:
             source_type = "list"
-        elif source_field in known_label_fields:
+        elif source_field in KNOWN_LABEL_FIELDS:
             source_type = "label"
         else:
             # Assume same type as destination for custom fields
@@ -524,6 +582,7 @@ Examples:
                 dest_type=field_type,
                 move=is_move,
                 dry_run=parsed_args.dry_run,
+                quiet=parsed_args.quiet,
             )
         except ValueError as e:
             parser.error(str(e))
@@ -543,15 +602,12 @@ Examples:
             set_value=parsed_args.set,
             remove=bool(parsed_args.remove),
             dry_run=parsed_args.dry_run,
+            quiet=parsed_args.quiet,
         )
     else:
         # Handle list fields
-        add_items = set(parsed_args.add.split(",")) if parsed_args.add else set()
-        remove_items = set(parsed_args.remove.split(",")) if parsed_args.remove else set()
-
-        # Strip whitespace
-        add_items = {item.strip() for item in add_items}
-        remove_items = {item.strip() for item in remove_items}
+        add_items = split_items(parsed_args.add)
+        remove_items = split_items(parsed_args.remove)
 
         if add_items:
             print(f"Adding {field}: {sorted(add_items)}")
@@ -560,16 +616,24 @@ Examples:
         print()
 
         modified_count = manager.modify_metadata(
-            selected_posts, field, add_items, remove_items, dry_run=parsed_args.dry_run
+            selected_posts,
+            field,
+            add_items,
+            remove_items,
+            dry_run=parsed_args.dry_run,
+            quiet=parsed_args.quiet,
         )
 
+    # Saved posts have new mtimes, so keep their cache entries valid for the next run
+    manager.save_cache()
+
     print()
-    print(f"{'='*60}")
+    print(BANNER)
     if parsed_args.dry_run:
         print(f"[DRY RUN] Would modify {modified_count} of {len(selected_posts)} posts")
     else:
         print(f"Modified {modified_count} of {len(selected_posts)} posts")
-    print(f"{'='*60}")
+    print(BANNER)
 
     return 0
 
@@ -7,90 +7,497 @@ Shared utilities for working with Hugo markdown post files.
 
 import argparse
 import json
+import os
+import pickle
 import re
-import sys
-from datetime import datetime
+import stat
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
-import yaml
+# PyYAML, tomllib/tomli (for reading TOML), tomlkit (for style-preserving TOML writing) and
+# concurrent.futures (whose process pool pulls in multiprocessing) are imported where they
+# are first needed, so that startup and --help don't pay for them
 
-# Import tomlkit for style-preserving TOML writing
-import tomlkit
+# Post loading and saving is I/O-bound, so use more threads than cores
+IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Loads with at least this many posts to parse (not served by the frontmatter cache)
+# are parsed in worker processes instead of threads
+PROCESS_LOAD_THRESHOLD = 2000
+
+# Posts larger than this many bytes have their frontmatter parsed from the first
+# HEAD_READ_SIZE characters, and the rest of the post is only read if it is used
+HEAD_READ_SIZE = 16384
+
+# Posts are read with utf-8-sig so a leading byte order mark (as some Windows editors
+# write) doesn't hide the frontmatter delimiter from the first-character check
+POST_ENCODING = "utf-8-sig"
+
+# Rule printed around command headings and summaries
+BANNER = "=" * 60
+
+
+@lru_cache(maxsize=None)
+def _yaml_dumper():
+    """Get the YAML dumper, preferring the LibYAML-backed one when PyYAML was built with it."""
+    try:
+        from yaml import CSafeDumper as dumper
+    except ImportError:
+        from yaml import SafeDumper as dumper
+    return dumper
+
+
+@lru_cache(maxsize=None)
+def _yaml_loader():
+    """Get the YAML loader, preferring the LibYAML-backed one when PyYAML was built with it."""
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader
+    return loader
+
+
+def load_yaml(text: str):
+    """Parse YAML frontmatter, restricted to standard tags like yaml.safe_load()."""
+    import yaml
+
+    return yaml.load(text, Loader=_yaml_loader())
+
+
+# Strings that PyYAML writes unquoted in every context: words of ASCII letters, digits
+# and a few punctuation characters, starting with a letter, separated by single spaces
+_PLAIN_YAML_STRING = re.compile(r"[A-Za-z][\w./-]*(?: [\w./-]+)*", re.ASCII)
+_YAML_RESERVED_WORDS = frozenset(
+    word
+    for base in ("yes", "no", "true", "false", "on", "off", "null")
+    for word in (base, base.capitalize(), base.upper())
+)
+# PyYAML starts folding long scalars at this column
+_YAML_LINE_WIDTH = 80
+
+
+def _yaml_scalar(value) -> Optional[str]:
+    """Format a scalar the way PyYAML would, or return None if it might need quoting."""
+    value_type = type(value)
+    if value_type is str:
+        if _PLAIN_YAML_STRING.fullmatch(value) and value not in _YAML_RESERVED_WORDS:
+            return value
+        return None
+    if value_type is bool:
+        return "true" if value else "false"
+    if value_type is int:
+        return str(value)
+    if value_type is datetime:
+        return value.isoformat(" ")
+    if value_type is date:
+        return value.isoformat()
+    if value is None:
+        return "null"
+    return None
+
+
+def _dump_simple_yaml(data: Dict) -> Optional[str]:
+    """Serialize typical frontmatter (scalars and lists of scalars) without PyYAML.
+
+    Returns None for anything else, including strings that might need quoting or
+    folding, so that the caller can fall back to yaml.dump() for an identical result.
+    """
+    if not data:
+        return None
+    lines = []
+    append = lines.append
+    for key, value in data.items():
+        if type(key) is not str or not _PLAIN_YAML_STRING.fullmatch(key):
+            return None
+        if key in _YAML_RESERVED_WORDS:
+            return None
+        if type(value) is list:
+            if not value:
+                append(f"{key}: []")
+                continue
+            append(f"{key}:")
+            for item in value:
+                text = _yaml_scalar(item)
+                if text is None or len(text) + 2 > _YAML_LINE_WIDTH:
+                    return None
+                append(f"- {text}")
+        else:
+            text = _yaml_scalar(value)
+            if text is None or len(key) + len(text) + 2 > _YAML_LINE_WIDTH:
+                return None
+            append(f"{key}: {text}")
+    append("")
+    return "\n".join(lines)
+
+
+def dump_yaml(data: Dict) -> str:
+    """Serialize frontmatter to YAML, keeping key order and unicode characters."""
+    # Most frontmatter is a few plain scalars and lists, which don't need PyYAML's emitter
+    text = _dump_simple_yaml(data)
+    if text is not None:
+        return text
+
+    import yaml
+
+    return yaml.dump(
+        data, Dumper=_yaml_dumper(), default_flow_style=False, allow_unicode=True, sort_keys=False
+    )
+
+
+def load_toml(text: str) -> Dict:
+    """Parse TOML frontmatter into plain Python values."""
+    try:
+        import tomllib
+    except ImportError:  # Python < 3.11
+        import tomli as tomllib
+
+    return tomllib.loads(text)
+
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_file(path: Path, data: bytes):
+    """Write bytes to a file with raw os.write calls, bypassing Python's buffered I/O.
+
+    No newline translation is done, so files always get the \\n line endings they
+    were serialized with.
+    """
+    view = memoryview(data)
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def format_heading(title: str) -> str:
+    """Format a report heading framed above and below by banner rules."""
+    return f"{BANNER}\n{title}\n{BANNER}"
+
+
+def default_cache_file() -> Path:
+    """Get the default frontmatter cache location (under $XDG_CACHE_HOME or ~/.cache)."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "hugotools" / "frontmatter.pkl"
+
+
+class ContentDirMissing(FileNotFoundError):
+    """Raised when loading posts from a content directory that does not exist."""
+
+
+class FrontmatterCache:
+    """On-disk cache of parsed YAML frontmatter, keyed by file path, mtime and size.
+
+    Unchanged posts are loaded from the cache on later runs instead of being
+    re-parsed, and their text is only read if it is needed. The cache is
+    best-effort: a missing, corrupt or unwritable cache file just means
+    frontmatter is parsed as usual.
+    """
+
+    def __init__(self, cache_file: Optional[Path] = None):
+        self.cache_file = cache_file or default_cache_file()
+        self._entries: Dict[str, tuple] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        """Load cache entries from disk, ignoring any problems reading them."""
+        try:
+            with open(self.cache_file, "rb") as f:
+                entries = pickle.load(f)
+        except Exception:
+            return
+        if isinstance(entries, dict):
+            self._entries = entries
+
+    def get(self, file_path: Path, stat_result: os.stat_result) -> Optional[Dict]:
+        """Get the cached frontmatter for a file, or None if missing or stale."""
+        entry = self._entries.get(os.path.abspath(file_path))
+        if entry is None:
+            return None
+        mtime_ns, size, data = entry
+        if mtime_ns != stat_result.st_mtime_ns or size != stat_result.st_size:
+            return None
+        # Entries are stored pickled so every caller gets its own copy
+        return pickle.loads(data)
+
+    def is_fresh(self, file_path: Path, stat_result: os.stat_result) -> bool:
+        """Check whether the file has an up-to-date cache entry."""
+        entry = self._entries.get(os.path.abspath(file_path))
+        return (
+            entry is not None
+            and entry[0] == stat_result.st_mtime_ns
+            and entry[1] == stat_result.st_size
+        )
+
+    def set(self, file_path: Path, stat_result: os.stat_result, frontmatter: Dict):
+        """Store the parsed frontmatter for a file."""
+        data = pickle.dumps(frontmatter, protocol=pickle.HIGHEST_PROTOCOL)
+        self._entries[os.path.abspath(file_path)] = (
+            stat_result.st_mtime_ns,
+            stat_result.st_size,
+            data,
+        )
+        self._dirty = True
+
+    def save(self):
+        """Write the cache back to disk atomically if anything changed."""
+        if not self._dirty:
+            return
+        tmp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, "wb") as f:
+                pickle.dump(self._entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, self.cache_file)
+        except OSError:
+            return
+        self._dirty = False
+
+
+def _skip_line_end(text: str, pos: int) -> int:
+    """Skip the whitespace at pos, returning the index just past its last newline (or -1)."""
+    line_start = -1
+    end = len(text)
+    while pos < end and text[pos].isspace():
+        pos += 1
+        if text[pos - 1] == "\n":
+            line_start = pos
+    return line_start
+
+
+def _split_frontmatter(text: str) -> Optional[Tuple[str, str, str]]:
+    """Split a post into (format, raw frontmatter, content), or None without frontmatter.
+
+    The format is decided by the first character, and the closing delimiter is found
+    with str.find rather than scanning the whole post with a regex.
+    """
+    first = text[:1]
+    if first == "{":
+        # JSON: the frontmatter runs up to (and includes) the first line starting with }
+        pos = text.find("\n}", 1)
+        while pos != -1:
+            content_start = _skip_line_end(text, pos + 2)
+            if content_start != -1:
+                return "json", text[: pos + 2], text[content_start:]
+            pos = text.find("\n}", pos + 2)
+        return None
+
+    if first == "-":
+        fmt, fence = "yaml", "---"
+    elif first == "+":
+        fmt, fence = "toml", "+++"
+    else:
+        return None
+    if not text.startswith(fence):
+        return None
+
+    start = _skip_line_end(text, 3)
+    if start == -1:
+        return None
+
+    # The closing fence is a line starting with the delimiter, followed only by whitespace
+    marker = "\n" + fence
+    pos = text.find(marker, start)
+    while pos != -1:
+        content_start = _skip_line_end(text, pos + 4)
+        if content_start != -1:
+            return fmt, text[start : pos + 1], text[content_start:]
+        pos = text.find(marker, pos + 1)
+
+    # Frontmatter of only blank lines: the closing fence directly follows the opening
+    if text.startswith(fence, start):
+        prev = text.rfind("\n", 3, start - 1)
+        content_start = _skip_line_end(text, start + 3)
+        if prev != -1 and content_start != -1:
+            return fmt, text[prev + 1 : start], text[content_start:]
+    return None
 
 
 class HugoPost:
     """Represents a Hugo post with frontmatter and content."""
 
-    def __init__(self, file_path: Path):
+    # Sites can have thousands of posts in memory at once, so don't give each a __dict__
+    __slots__ = (
+        "_content",
+        "_date_cache",
+        "_frontmatter_cache",
+        "_frontmatter_raw",
+        "_stat",
+        "_text_loaded",
+        "_text_lower_cache",
+        "_title_lower_cache",
+        "_toml_parse_failed",
+        "_yaml_parse_failed",
+        "file_name",
+        "file_path",
+        "frontmatter",
+        "frontmatter_format",
+        "has_frontmatter",
+        "toml_document",
+    )
+
+    def __init__(
+        self,
+        file_path: Path,
+        stat_result: Optional[os.stat_result] = None,
+        frontmatter_cache: Optional[FrontmatterCache] = None,
+        text: Optional[str] = None,
+    ):
         self.file_path = file_path
+        self.file_name = file_path.name  # Used in every per-post report line
+        self._stat = stat_result  # Captured during the directory scan, if available
+        self._frontmatter_cache = frontmatter_cache
         self.frontmatter: Dict = {}
-        self.content: str = ""
-        self.frontmatter_raw: str = ""
+        self._content = ""
+        self._frontmatter_raw = ""
+        self._text_loaded = True  # False while the post text is still to be read (see content)
         self.has_frontmatter: bool = False
         self.frontmatter_format: str = "yaml"  # Track format: yaml, toml, or json
-        self.toml_document = None  # Store tomlkit document to preserve comments
-        self._parse()
-
-    def _parse(self):
-        """Parse the Hugo post file to extract frontmatter and content."""
-        with open(self.file_path, encoding="utf-8") as f:
-            text = f.read()
-
-        # Try YAML frontmatter (delimited by ---)
-        yaml_pattern = r"^---\s*\n(.*?\n)---\s*\n(.*)$"
-        match = re.match(yaml_pattern, text, re.DOTALL)
-
-        if match:
-            self.has_frontmatter = True
-            self.frontmatter_format = "yaml"
-            self.frontmatter_raw = match.group(1)
-            self.content = match.group(2)
+        self.toml_document = None  # tomlkit document preserving comments, built on save
+        self._toml_parse_failed = False
+        self._yaml_parse_failed = False  # Set when YAML frontmatter couldn't be parsed
+        # (raw value, result) of the last get_date()/get_title_lower() call, reused while the
+        # frontmatter still holds the same value object
+        self._date_cache = None
+        self._title_lower_cache = None
+        # (frontmatter_raw, content, and both lower-cased) from the last contains_text() call
+        self._text_lower_cache = None
+        self._parse(text)
+
+    @classmethod
+    def from_string(cls, text: str, file_path: Optional[Path] = None) -> "HugoPost":
+        """Create a post from its full text instead of reading it from a file.
+
+        The file path (a placeholder by default) is only used in messages and by save().
+        """
+        return cls(file_path or Path("<string>"), text=text)
+
+    @property
+    def content(self) -> str:
+        """The post body after the frontmatter."""
+        self._ensure_text()
+        return self._content
+
+    @content.setter
+    def content(self, value: str):
+        self._ensure_text()
+        self._content = value
+
+    @property
+    def frontmatter_raw(self) -> str:
+        """The frontmatter text as found in the file, without its delimiters."""
+        self._ensure_text()
+        return self._frontmatter_raw
+
+    @frontmatter_raw.setter
+    def frontmatter_raw(self, value: str):
+        self._ensure_text()
+        self._frontmatter_raw = value
+
+    def _ensure_text(self):
+        """Read the post text if only the frontmatter was loaded (from the cache or file head)."""
+        if self._text_loaded:
+            return
+        self._text_loaded = True
+        text = self._read_text()
+        parts = _split_frontmatter(text)
+        if parts is None:
+            self._content = text
+        else:
+            _, self._frontmatter_raw, self._content = parts
+
+    def _read_text(self) -> str:
+        """Read the post file's text."""
+        with open(self.file_path, encoding=POST_ENCODING) as f:
+            return f.read()
+
+    def _split_head(self) -> Optional[Tuple[str, str, str]]:
+        """Split the frontmatter from the start of the file, leaving the body unread.
+
+        Returns None if the frontmatter doesn't end within the first HEAD_READ_SIZE characters.
+        """
+        with open(self.file_path, encoding=POST_ENCODING) as f:
+            head = f.read(HEAD_READ_SIZE)
+        parts = _split_frontmatter(head)
+        # The split is only final once something other than whitespace follows the closing
+        # delimiter, as the whitespace after it could continue past the end of the head.
+        # Blank frontmatter is only used when no later closing delimiter exists, so it
+        # can't be decided from the head either.
+        if parts is None or not parts[1].strip() or not parts[2].strip():
+            return None
+        return parts[0], parts[1], ""
+
+    def _parse(self, text: Optional[str] = None):
+        """Parse the post's text (read from its file if not given) into frontmatter and content."""
+        cache = self._frontmatter_cache if self._stat is not None else None
+        parts = None
+        if text is None:
+            # Only YAML frontmatter is cached. A cache hit means the file doesn't need to be
+            # read at all unless its text is used (for --text, get_full_text() or a save).
+            if cache is not None:
+                cached = cache.get(self.file_path, self._stat)
+                if cached is not None:
+                    self.has_frontmatter = True
+                    self.frontmatter_format = "yaml"
+                    self.frontmatter = cached
+                    self._text_loaded = False
+                    return
+
+            if self._stat is not None and self._stat.st_size > HEAD_READ_SIZE:
+                parts = self._split_head()
+            if parts is not None:
+                self._text_loaded = False
+            else:
+                text = self._read_text()
+
+        if parts is None:
+            parts = _split_frontmatter(text)
+            if parts is None:
+                # No frontmatter found
+                self._content = text
+                return
+
+        self.has_frontmatter = True
+        self.frontmatter_format, self._frontmatter_raw, self._content = parts
+
+        if self.frontmatter_format == "yaml":
+            import yaml
+
             try:
-                self.frontmatter = yaml.safe_load(self.frontmatter_raw) or {}
+                self.frontmatter = load_yaml(self._frontmatter_raw) or {}
             except yaml.YAMLError as e:
                 print(f"Warning: Failed to parse YAML in {self.file_path}: {e}")
                 self.frontmatter = {}
-            return
+                self._yaml_parse_failed = True
+                return
 
-        # Try TOML frontmatter (delimited by +++)
-        toml_pattern = r"^\+\+\+\s*\n(.*?\n)\+\+\+\s*\n(.*)$"
-        match = re.match(toml_pattern, text, re.DOTALL)
+            if cache is not None:
+                cache.set(self.file_path, self._stat, self.frontmatter)
 
-        if match:
-            self.has_frontmatter = True
-            self.frontmatter_format = "toml"
-            self.frontmatter_raw = match.group(1)
-            self.content = match.group(2)
+        elif self.frontmatter_format == "toml":
+            # The style-preserving tomlkit document is only needed when the post is saved
             try:
-                # Use tomlkit to preserve comments and formatting
-                self.toml_document = tomlkit.loads(self.frontmatter_raw)
-                # Also keep a dict version for easy access
-                self.frontmatter = dict(self.toml_document)
+                self.frontmatter = load_toml(self._frontmatter_raw)
             except Exception as e:
                 print(f"Warning: Failed to parse TOML in {self.file_path}: {e}")
                 self.frontmatter = {}
-                self.toml_document = None
-            return
+                self._toml_parse_failed = True
 
-        # Try JSON frontmatter (starts with { and ends with })
-        json_pattern = r"^(\{[\s\S]*?\n\})\s*\n(.*)$"
-        match = re.match(json_pattern, text, re.DOTALL)
-
-        if match:
-            self.has_frontmatter = True
-            self.frontmatter_format = "json"
-            self.frontmatter_raw = match.group(1)
-            self.content = match.group(2)
+        else:  # json
             try:
-                self.frontmatter = json.loads(self.frontmatter_raw)
+                self.frontmatter = json.loads(self._frontmatter_raw)
             except json.JSONDecodeError as e:
                 print(f"Warning: Failed to parse JSON in {self.file_path}: {e}")
                 self.frontmatter = {}
-            return
 
-        # No frontmatter found
-        self.content = text
+    def has_field(self, field: str) -> bool:
+        """Check whether the frontmatter has a value for a field."""
+        return field in self.frontmatter
 
     def get_metadata_list(self, field: str) -> list:
         """Get a metadata field as a list (handles both single values and lists)."""
@@ -130,37 +537,135 @@ class HugoPost:
         """Get the post title."""
         return self.frontmatter.get("title", "")
 
+    def get_title_lower(self) -> str:
+        """Get the post title lower-cased, for case-insensitive matching."""
+        title = self.get_title()
+        cached = self._title_lower_cache
+        if cached is None or cached[0] is not title:
+            cached = self._title_lower_cache = (title, title.lower())
+        return cached[1]
+
     def get_date(self) -> Optional[datetime]:
         """Get the post date."""
-        date_str = self.frontmatter.get("date", "")
+        date_value = self.frontmatter.get("date", "")
+        cached = self._date_cache
+        if cached is None or cached[0] is not date_value:
+            cached = self._date_cache = (date_value, self._parse_date(date_value))
+        return cached[1]
+
+    @staticmethod
+    def _parse_date(date_str) -> Optional[datetime]:
+        """Parse a frontmatter date value."""
         if not date_str:
             return None
 
+        # Remove timezone info for simplicity
+        date_str_clean = str(date_str).split("+")[0].strip().strip("'\"")
+        # A trailing Z (UTC) is only accepted by fromisoformat from Python 3.11
+        if date_str_clean[-1:] in ("Z", "z"):
+            date_str_clean = date_str_clean[:-1]
+
+        # Hugo dates are almost always ISO 8601, which fromisoformat parses in one step
+        try:
+            return datetime.fromisoformat(date_str_clean).replace(tzinfo=None)
+        except ValueError:
+            pass
+
         # Try to parse various date formats
-        date_str = str(date_str)
-        for fmt in ["%Y-%m-%d %H:%M:%S%z", "%Y-%m-%d", "%Y-%m-%dT%H:%M:%S%z"]:
+        for fmt in ["%Y-%m-%d %H:%M:%S", "%Y-%m-%d", "%Y-%m-%dT%H:%M:%S"]:
             try:
-                # Remove timezone info for simplicity
-                date_str_clean = date_str.split("+")[0].strip().strip("'\"")
-                return datetime.strptime(date_str_clean, fmt.split("%z")[0].strip())
+                return datetime.strptime(date_str_clean, fmt)
             except ValueError:
                 continue
         return None
 
+    def get_stat(self) -> os.stat_result:
+        """Get the file's stat result, reusing the one captured when it was loaded."""
+        if self._stat is None:
+            self._stat = self.file_path.stat()
+        return self._stat
+
     def get_full_text(self) -> str:
         """Get the full text of the post (frontmatter + content)."""
         return f"{self.frontmatter_raw}\n{self.content}"
 
+    def contains_text(self, text: str) -> bool:
+        """Check whether the full text of the post contains text, ignoring case.
+
+        The frontmatter and content are searched separately (their lower-cased copies are
+        kept for later calls), so the full text is never built and lower-cased as a whole.
+        """
+        raw, content = self.frontmatter_raw, self.content
+        cached = self._text_lower_cache
+        if cached is None or cached[0] is not raw or cached[1] is not content:
+            cached = self._text_lower_cache = (raw, content, raw.lower(), content.lower())
+        raw_lower, content_lower = cached[2], cached[3]
+
+        text = text.lower()
+        if "\n" in text:
+            # The text could span the newline joining the frontmatter and content
+            return text in f"{raw_lower}\n{content_lower}"
+        return text in raw_lower or text in content_lower
+
+    def refresh_stat(self):
+        """Re-stat the file after it changed on disk, keeping any cached frontmatter current."""
+        self._stat = self.file_path.stat()
+        if self._frontmatter_cache is not None and self.frontmatter_format == "yaml":
+            self._frontmatter_cache.set(self.file_path, self._stat, self.frontmatter)
+
     def save(self):
-        """Save the post back to disk, preserving the original frontmatter format."""
+        """Save the post back to disk, preserving the original frontmatter format.
+
+        The text is written to a temporary file next to the post and renamed over it,
+        so a failed save never leaves a truncated post behind. A symlinked post has the
+        file it points to replaced, and keeps its mode, owner and group. A hardlinked post
+        is written in place, as renaming would split it from its other links. If the file
+        already holds exactly this text it is left alone, so its mtime doesn't change.
+        """
+        data = self._serialize().encode("utf-8")
+        file_stat = self.get_stat()
+        # A size mismatch already proves the text changed, so only read back on a match
+        if file_stat.st_size == len(data) and self._file_bytes() == data:
+            return
+        target = self.file_path.resolve()
+        if file_stat.st_nlink > 1:
+            _write_file(target, data)
+            self.refresh_stat()
+            return
+        tmp_path = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+        try:
+            _write_file(tmp_path, data)
+            os.chmod(tmp_path, stat.S_IMODE(file_stat.st_mode))
+            if hasattr(os, "chown"):
+                try:
+                    os.chown(tmp_path, file_stat.st_uid, file_stat.st_gid)
+                except PermissionError:
+                    pass  # Only root can give files away; keep the saving user's ownership
+            os.replace(tmp_path, target)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        self.refresh_stat()  # Writing changes size and mtime
+
+    def _file_bytes(self) -> Optional[bytes]:
+        """Read the post file's current contents, or None if it can't be read."""
+        try:
+            with open(self.file_path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _serialize(self) -> str:
+        """Serialize the frontmatter and content into the full text of the post file."""
         # Serialize frontmatter based on the original format
         if self.frontmatter_format == "yaml":
-            frontmatter_str = yaml.dump(
-                self.frontmatter, default_flow_style=False, allow_unicode=True, sort_keys=False
-            )
+            frontmatter_str = dump_yaml(self.frontmatter)
             delimiter = "---"
         elif self.frontmatter_format == "toml":
+            import tomlkit
+
             # Use tomlkit to preserve comments and formatting
+            self._ensure_toml_document()
             if self.toml_document is not None:
                 # Update the tomlkit document with any changes from self.frontmatter
                 self._update_toml_document()
@@ -172,76 +677,171 @@ class HugoPost:
         elif self.frontmatter_format == "json":
             frontmatter_str = json.dumps(self.frontmatter, indent=2, ensure_ascii=False)
             # JSON doesn't use delimiters in the same way - the braces are part of the JSON
-            # Write the file
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                f.write(frontmatter_str)
-                f.write("\n")
-                f.write(self.content)
-            return
+            return f"{frontmatter_str}\n{self.content}"
         else:
             # Default to YAML if format is unknown
-            frontmatter_str = yaml.dump(
-                self.frontmatter, default_flow_style=False, allow_unicode=True, sort_keys=False
-            )
+            frontmatter_str = dump_yaml(self.frontmatter)
             delimiter = "---"
 
-        # Write the file with delimiters
-        with open(self.file_path, "w", encoding="utf-8") as f:
-            f.write(f"{delimiter}\n")
-            f.write(frontmatter_str)
-            f.write(f"{delimiter}\n")
-            f.write(self.content)
+        return f"{delimiter}\n{frontmatter_str}{delimiter}\n{self.content}"
+
+    def _ensure_toml_document(self):
+        """Parse the raw TOML frontmatter with tomlkit, the first time it is needed."""
+        if self.toml_document is not None or self._toml_parse_failed:
+            return
+        import tomlkit
+
+        try:
+            self.toml_document = tomlkit.loads(self.frontmatter_raw)
+        except Exception:
+            self._toml_parse_failed = True
 
     def _update_toml_document(self):
         """Update the tomlkit document with changes from self.frontmatter."""
         if self.toml_document is None:
             return
 
-        # Get keys that exist in both
-        doc_keys = set(self.toml_document.keys())
-        fm_keys = set(self.frontmatter.keys())
-
-        # Update existing keys and add new keys
-        for key in fm_keys:
-            self.toml_document[key] = self.frontmatter[key]
+        # Only replace values that changed, so untouched keys keep their formatting
+        for key, value in self.frontmatter.items():
+            if key not in self.toml_document or self.toml_document[key] != value:
+                self.toml_document[key] = value
 
         # Remove keys that are no longer in frontmatter
-        for key in doc_keys - fm_keys:
+        for key in set(self.toml_document.keys()) - self.frontmatter.keys():
             del self.toml_document[key]
 
-    def _prepare_for_toml(self, data):
-        """Prepare data for TOML serialization by converting datetime objects."""
-        if isinstance(data, dict):
-            return {k: self._prepare_for_toml(v) for k, v in data.items()}
-        elif isinstance(data, list):
-            return [self._prepare_for_toml(item) for item in data]
-        elif isinstance(data, datetime):
-            return data.isoformat()
-        return data
-
 
 class HugoPostManager:
     """Base manager for Hugo posts with common loading and filtering functionality."""
 
-    def __init__(self, content_dir: Path = Path("content/posts")):
+    def __init__(
+        self,
+        content_dir: Path = Path("content/posts"),
+        frontmatter_cache: Optional[FrontmatterCache] = None,
+        jobs: Optional[int] = None,
+    ):
         self.content_dir = content_dir
+        self.frontmatter_cache = frontmatter_cache
+        self.jobs = jobs  # Worker threads/processes for loading and saving (None: automatic)
         self.posts: List[HugoPost] = []
 
     def load_posts(self):
         """Load all markdown posts from the content directory."""
+        self._check_content_dir()
+
+        # scandir rather than glob so each file's stat can be kept with its post
+        with os.scandir(self.content_dir) as entries:
+            files = [
+                (Path(entry.path), entry.stat())
+                for entry in entries
+                if entry.name.endswith(".md") and entry.is_file()
+            ]
+
+        self._load_files(files)
+
+    def load_specific_posts(self, paths: List[str]):
+        """Load only the given posts, for --path selections, instead of scanning the directory.
+
+        Paths that are not markdown files inside the content directory (directly, or
+        through a symlink in either direction) are skipped here and reported when the
+        posts are filtered.
+        """
+        self._check_content_dir()
+
+        content_dir = self.content_dir.resolve()
+        files = {}
+        # Files elsewhere that a symlink in the content directory might point to
+        link_targets = set()
+
+        def add(file_path: Path):
+            if file_path.name.endswith(".md") and file_path not in files and file_path.is_file():
+                files[file_path] = file_path.stat()
+
+        for path_str in paths:
+            # Match on the path as given, so a post that is a symlink to a file elsewhere
+            # is still found by its name in the content directory
+            path = Path(path_str).absolute()
+            if path.parent.resolve() == content_dir:
+                add(self.content_dir / path.name)
+                continue
+            resolved = path.resolve()
+            if resolved.parent == content_dir:
+                add(self.content_dir / resolved.name)
+            elif resolved.is_file():
+                link_targets.add(resolved)
+
+        if link_targets:
+            with os.scandir(self.content_dir) as entries:
+                for entry in entries:
+                    if entry.is_symlink() and Path(entry.path).resolve() in link_targets:
+                        add(Path(entry.path))
+
+        self._load_files(list(files.items()))
+
+    def _check_content_dir(self):
+        """Raise ContentDirMissing if the content directory does not exist."""
         if not self.content_dir.exists():
-            print(f"Error: Content directory '{self.content_dir}' does not exist")
-            sys.exit(1)
+            raise ContentDirMissing(f"Content directory '{self.content_dir}' does not exist")
+
+    def _load_files(self, files: List[tuple]):
+        """Load posts from (path, stat) pairs, keeping those that have frontmatter."""
+        cache = self.frontmatter_cache
+
+        def load(file):
+            return HugoPost(file[0], file[1], cache)
+
+        # Reading files is I/O-bound, but parsing thousands of uncached posts is
+        # CPU-bound and serialised by the GIL, so hand those to worker processes
+        uncached = [file for file in files if cache is None or not cache.is_fresh(*file)]
+        if len(uncached) < PROCESS_LOAD_THRESHOLD or (self.jobs or os.cpu_count() or 1) < 2:
+            posts = self._map_io(load, files)
+        else:
+            from concurrent.futures import ProcessPoolExecutor
 
-        self.posts = []
-        for md_file in self.content_dir.glob("*.md"):
-            post = HugoPost(md_file)
-            if post.has_frontmatter:
-                self.posts.append(post)
+            with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                results = list(executor.map(_load_post, uncached, chunksize=64))
+            parsed = {}
+            for file, (post, parse_failed) in zip(uncached, results):
+                post._frontmatter_cache = cache
+                # Cache the same posts the threaded load would: parsed YAML, even if empty
+                if (
+                    cache is not None
+                    and post.has_frontmatter
+                    and post.frontmatter_format == "yaml"
+                    and not parse_failed
+                ):
+                    cache.set(post.file_path, post.get_stat(), post.frontmatter)
+                parsed[file] = post
+            cached = [file for file in files if file not in parsed]
+            parsed.update(zip(cached, self._map_io(load, cached)))
+            posts = [parsed[file] for file in files]
+
+        self.posts = [post for post in posts if post.has_frontmatter]
+
+        self.save_cache()
 
         print(f"Loaded {len(self.posts)} posts from {self.content_dir}")
 
-    def filter_posts(
+    def save_posts(self, posts: List[HugoPost]):
+        """Save posts back to disk, writing independent files concurrently."""
+        self._map_io(HugoPost.save, posts)
+
+    def _map_io(self, func, items: list) -> list:
+        """Apply an I/O-bound function to each item on a thread pool, keeping order."""
+        workers = min(self.jobs or IO_WORKERS, len(items))
+        if workers <= 1:
+            return [func(item) for item in items]
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, items))
+
+    def save_cache(self):
+        """Write the frontmatter cache back to disk, if one is in use."""
+        if self.frontmatter_cache is not None:
+            self.frontmatter_cache.save()
+
+    def iter_posts(
         self,
         select_all: bool = False,
         title_pattern: Optional[str] = None,
@@ -249,52 +849,88 @@ class HugoPostManager:
         to_date: Optional[datetime] = None,
         text_pattern: Optional[str] = None,
         paths: Optional[List[str]] = None,
-    ) -> List[HugoPost]:
-        """Filter posts based on selection criteria."""
+    ) -> Iterator[HugoPost]:
+        """Yield the posts matching the selection criteria, in load order."""
 
         if select_all:
-            return self.posts
+            yield from self.posts
+            return
 
         # Path-based selection
         if paths:
-            filtered = []
+            # Resolve each post's path once, rather than once per requested path. The first
+            # post wins if several resolve to the same file (e.g. through symlinks).
+            posts_by_path = {}
+            for post in self.posts:
+                posts_by_path.setdefault(post.file_path.resolve(), post)
+
             for path_str in paths:
-                # Convert to absolute path
-                path = Path(path_str).resolve()
-
-                # Find matching post
-                found = False
-                for post in self.posts:
-                    if post.file_path.resolve() == path:
-                        filtered.append(post)
-                        found = True
-                        break
-
-                if not found:
+                # Convert to absolute path and look up the matching post
+                post = posts_by_path.get(Path(path_str).resolve())
+                if post is not None:
+                    yield post
+                else:
                     print(f"Warning: Path not found or no frontmatter: {path_str}")
+            return
+
+        # Patterns are plain case-insensitive substrings; lower-case them once, not per post
+        title_pattern = title_pattern.lower() if title_pattern else None
 
-            return filtered
+        # Dates are only parsed when a date filter is active
+        check_dates = from_date is not None or to_date is not None
 
-        filtered = []
         for post in self.posts:
             # Title filter
-            if title_pattern and title_pattern.lower() not in post.get_title().lower():
+            if title_pattern and title_pattern not in post.get_title_lower():
                 continue
 
             # Date filters
-            post_date = post.get_date()
-            if from_date and (not post_date or post_date < from_date):
-                continue
-            if to_date and (not post_date or post_date > to_date):
-                continue
+            if check_dates:
+                post_date = post.get_date()
+                if not post_date:
+                    continue
+                if from_date and post_date < from_date:
+                    continue
+                if to_date and post_date > to_date:
+                    continue
 
             # Text filter
-            if text_pattern and text_pattern.lower() not in post.get_full_text().lower():
+            if text_pattern and not post.contains_text(text_pattern):
                 continue
 
-            filtered.append(post)
+            yield post
+
+    def filter_posts(
+        self,
+        select_all: bool = False,
+        title_pattern: Optional[str] = None,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+        text_pattern: Optional[str] = None,
+        paths: Optional[List[str]] = None,
+    ) -> List[HugoPost]:
+        """Filter posts based on selection criteria."""
+        if select_all:
+            return self.posts
+        return list(
+            self.iter_posts(
+                title_pattern=title_pattern,
+                from_date=from_date,
+                to_date=to_date,
+                text_pattern=text_pattern,
+                paths=paths,
+            )
+        )
+
+
+def _load_post(file: tuple) -> Tuple[HugoPost, bool]:
+    """Load a post from a (path, stat) pair in a worker process, without the cache.
 
-        return filtered
+    Returns the post and whether its YAML frontmatter failed to parse, so the parent
+    process knows which posts are safe to cache.
+    """
+    post = HugoPost(file[0], file[1])
+    return post, post._yaml_parse_failed
 
 
 def parse_date(date_str: str) -> datetime:
@@ -347,7 +983,7 @@ def add_post_selection_args(parser: argparse.ArgumentParser, include_text: bool
 
 
 def add_common_args(parser: argparse.ArgumentParser):
-    """Add common arguments (dry-run, content-dir) to an argument parser."""
+    """Add common arguments (dry-run, content-dir, jobs, quiet, no-cache) to an argument parser."""
     parser.add_argument(
         "--dry-run", action="store_true", help="Show what would be changed without modifying files"
     )
@@ -357,6 +993,30 @@ def add_common_args(parser: argparse.ArgumentParser):
         default=Path("content/posts"),
         help="Path to Hugo content directory (default: content/posts)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        metavar="N",
+        help=(
+            "Number of worker threads/processes for reading and writing posts "
+            f"(default: {IO_WORKERS} threads, or one process per CPU for large uncached loads)"
+        ),
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only print the summary, not the details of each changed post",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't read or update the parsed frontmatter cache",
+    )
+
+
+def make_frontmatter_cache(args) -> Optional[FrontmatterCache]:
+    """Create the frontmatter cache for a command run, unless --no-cache was given."""
+    return None if args.no_cache else FrontmatterCache()
 
 
 def validate_post_selection_args(args, parser: argparse.ArgumentParser, include_text: bool = True):
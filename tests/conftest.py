@@ -0,0 +1,59 @@
+"""Shared pytest configuration for hugotools tests."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep the frontmatter cache out of the real user cache directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
+# A small site shared (read-only) by the loading and filtering tests
+SAMPLE_POSTS = {
+    "python-tutorial.md": """---
+title: Python Tutorial 2023
+date: 2023-06-15
+---
+Learn Python programming. This post discusses machine learning.
+""",
+    "javascript.md": """---
+title: JavaScript Guide 2023
+date: 2023-06-20
+---
+Learn JavaScript. This is about web development.
+""",
+    "python-advanced.md": """---
+title: Python Advanced
+date: 2020-01-01
+---
+Advanced Python.
+""",
+    "toml-post.md": """+++
+title = "TOML Post"
+date = 2023-01-02
++++
+Content
+""",
+    "json-post.md": """{
+  "title": "JSON Post",
+  "date": "2023-01-03"
+}
+Content
+""",
+    # Not a post, so it should be ignored
+    "readme.txt": "Not a post",
+}
+
+
+@pytest.fixture(scope="session")
+def posts_dir(tmp_path_factory):
+    """A content directory of sample posts in every frontmatter format, written once.
+
+    Tests must not modify it; copy it to tmp_path first if they need to.
+    """
+    content_dir = tmp_path_factory.mktemp("site") / "posts"
+    content_dir.mkdir()
+    for name, text in SAMPLE_POSTS.items():
+        (content_dir / name).write_text(text)
+    return content_dir
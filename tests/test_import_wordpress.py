@@ -1,15 +1,63 @@
 """Tests for WordPress import command."""
 
+import pickle
+import xml.etree.ElementTree as ET
+
 import pytest
 
 from hugotools.commands.import_wordpress import (
+    WordPressPost,
     clean_html_entities,
     convert_code_blocks,
     convert_images,
+    convert_post,
+    convert_posts,
     detect_stray_html,
     generate_filename,
+    parse_wordpress_xml,
 )
 
+SAMPLE_EXPORT = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"
+    xmlns:content="http://purl.org/rss/1.0/modules/content/"
+    xmlns:dc="http://purl.org/dc/elements/1.1/"
+    xmlns:wp="http://wordpress.org/export/1.2/">
+<channel>
+    <item>
+        <title>Published</title>
+        <dc:creator><![CDATA[admin]]></dc:creator>
+        <content:encoded><![CDATA[<p>Hello</p>]]></content:encoded>
+        <wp:post_date>2023-01-15 10:30:00</wp:post_date>
+        <wp:post_name>published</wp:post_name>
+        <wp:status>publish</wp:status>
+        <wp:post_type>post</wp:post_type>
+        <category domain="category"><![CDATA[Tech]]></category>
+    </item>
+    <item>
+        <title>Draft</title>
+        <content:encoded><![CDATA[<p>Not yet</p>]]></content:encoded>
+        <wp:status>draft</wp:status>
+        <wp:post_type>post</wp:post_type>
+    </item>
+</channel>
+</rss>
+"""
+
+
+def make_item(post_name: str, content: str) -> ET.Element:
+    """Build a minimal WordPress <item> element."""
+    return ET.fromstring(f"""<item
+    xmlns:content="http://purl.org/rss/1.0/modules/content/"
+    xmlns:wp="http://wordpress.org/export/1.2/">
+    <title>{post_name}</title>
+    <content:encoded><![CDATA[{content}]]></content:encoded>
+    <wp:post_date>2023-01-15 10:30:00</wp:post_date>
+    <wp:post_name>{post_name}</wp:post_name>
+    <wp:status>publish</wp:status>
+    <wp:post_type>post</wp:post_type>
+    <category domain="post_tag"><![CDATA[python]]></category>
+</item>""")
+
 
 def test_clean_html_entities():
     """Test HTML entity conversion."""
@@ -18,6 +66,12 @@ def test_clean_html_entities():
     assert result == "Hello & goodbye <tag>"
 
 
+def test_clean_html_entities_double_encoded():
+    """Test numeric entities left over after unescaping are also converted."""
+    assert clean_html_entities("It&amp;#8217;s &amp;#x2014; done") == "It\u2019s \u2014 done"
+    assert clean_html_entities("plain text") == "plain text"
+
+
 def test_convert_code_blocks():
     """Test code block conversion."""
     html = """
@@ -33,6 +87,37 @@ def test_convert_code_blocks():
     assert 'print("hello")' in code_blocks[0]
 
 
+def test_convert_post_restores_code_blocks():
+    """Test that every code block placeholder is restored in place."""
+    content = (
+        '<p>First</p><pre><code class="language-python">x = 1</code></pre>'
+        "<p>Second</p><pre><code>echo &lt;hi&gt;</code></pre>"
+    )
+    markdown = convert_post(WordPressPost(make_item("code-post", content)))
+
+    assert "___CODEBLOCK_" not in markdown
+    assert markdown.index("```python\nx = 1\n```") < markdown.index("```\necho <hi>\n```")
+
+
+def test_convert_post_plain_text():
+    """Test that plain-text content keeps its paragraphs and has entities decoded."""
+    content = "First paragraph &amp; more.   \n\n\n\nSecond\\_paragraph."
+    markdown = convert_post(WordPressPost(make_item("plain-post", content)))
+
+    assert markdown.endswith("---\n\nFirst paragraph & more.\n\nSecond_paragraph.")
+
+
+def test_convert_post_plain_text_whitespace():
+    """Test that plain-text content has its whitespace normalized like HTML content."""
+    content = "Tab\there,  two  spaces. \n\t Indented line.\n \n\nNext paragraph."
+    plain = convert_post(WordPressPost(make_item("plain-post", content)))
+    html = convert_post(WordPressPost(make_item("plain-post", f"<p>{content}</p>")))
+
+    assert plain.endswith("---\n\nTab here, two spaces.\nIndented line.\n\nNext paragraph.")
+    # The HTML path gives the same text, apart from joining the paragraphs
+    assert html.endswith("---\n\nTab here, two spaces.\nIndented line.\nNext paragraph.")
+
+
 def test_convert_images():
     """Test image conversion."""
     html = '<p>Text <img src="image.jpg" alt="My Image"> more text</p>'
@@ -41,6 +126,25 @@ def test_convert_images():
     assert "![My Image](image.jpg)" in result
 
 
+def test_convert_images_caption_and_figure():
+    """Test caption shortcodes and figure wrappers are stripped around images."""
+    html = (
+        '[caption id="attachment_1" width="300"]'
+        "<figure class='wp-block-image'><IMG loading=lazy src='a.png' alt='A > B' /></figure>"
+        " A caption[/caption]"
+    )
+    result = convert_images(html)
+
+    assert result == "![A > B](a.png) A caption"
+
+
+def test_convert_images_repeated_attribute():
+    """Test that the last value of a repeated image attribute is used."""
+    result = convert_images('<img src="a.png" alt="first" alt="second">')
+
+    assert result == "![second](a.png)"
+
+
 def test_detect_stray_html():
     """Test detection of unconverted HTML."""
     markdown = """
@@ -59,6 +163,11 @@ Normal content here.
     # Brackets in code blocks should be ignored
 
 
+def test_detect_stray_html_tag_free():
+    """Test that markdown without any tags reports nothing."""
+    assert detect_stray_html("# Title\n\nJust *markdown* here.") == []
+
+
 def test_generate_filename():
     """Test filename generation."""
 
@@ -88,5 +197,106 @@ def test_generate_filename_from_title():
     assert filename == "hello-world-2023.md"
 
 
+def test_wordpress_post_is_picklable():
+    """Test that posts can be sent to worker processes."""
+    post = WordPressPost(make_item("my-post", "<p>Hello</p>"))
+    restored = pickle.loads(pickle.dumps(post))
+
+    assert restored.post_name == "my-post"
+    assert restored.tags == ["python"]
+    assert restored.should_export()
+
+
+def test_convert_posts_parallel_preserves_order():
+    """Test that parallel conversion yields results in post order."""
+    posts = [WordPressPost(make_item(f"post-{i}", f"<p>Body {i}</p>")) for i in range(4)]
+
+    results = list(convert_posts(posts, jobs=2))
+
+    assert [filename for filename, _, _, _ in results] == [f"post-{i}.md" for i in range(4)]
+    for i, (_, markdown, _, error) in enumerate(results):
+        assert error is None
+        assert f"Body {i}" in markdown
+
+
+def test_parse_wordpress_xml_streams_items(tmp_path):
+    """Test that only publishable posts are extracted from the export."""
+    xml_file = tmp_path / "export.xml"
+    xml_file.write_text(SAMPLE_EXPORT)
+
+    posts = parse_wordpress_xml(xml_file)
+
+    assert len(posts) == 1
+    assert posts[0].title == "Published"
+    assert posts[0].creator == "admin"
+    assert posts[0].content == "<p>Hello</p>"
+    assert posts[0].categories == ["Tech"]
+
+
+def test_import_run_writes_posts(tmp_path):
+    """Test that run() writes converted posts with their mtime set."""
+    from datetime import datetime
+
+    from hugotools.commands.import_wordpress import run
+
+    xml_file = tmp_path / "export.xml"
+    xml_file.write_text(SAMPLE_EXPORT)
+    output_dir = tmp_path / "output"
+
+    result = run([str(xml_file), "--output-dir", str(output_dir), "--jobs", "1"])
+
+    assert result == 0
+    output_file = output_dir / "published.md"
+    assert output_file.read_text(encoding="utf-8").startswith("---\ntitle: Published\n")
+    assert output_file.stat().st_mtime == datetime(2023, 1, 15, 10, 30).timestamp()
+
+
+def test_import_run_later_duplicate_post_wins(tmp_path, monkeypatch):
+    """Test that posts sharing an output filename are written in export order."""
+    import time
+
+    from hugotools.commands import import_wordpress
+
+    write_post = import_wordpress._write_post
+
+    def slow_first_write(output_path, markdown, timestamp_ns):
+        if "First" in markdown:
+            time.sleep(0.05)  # Without ordering, the second write would finish first
+        write_post(output_path, markdown, timestamp_ns)
+
+    monkeypatch.setattr(import_wordpress, "_write_post", slow_first_write)
+    duplicate = SAMPLE_EXPORT.replace("<p>Hello</p>", "<p>First</p>", 1)
+    item_start = duplicate.index("<item>")
+    item_end = duplicate.index("</item>") + len("</item>")
+    second = duplicate[item_start:item_end].replace("<p>First</p>", "<p>Second</p>")
+    xml_file = tmp_path / "export.xml"
+    xml_file.write_text(duplicate[:item_end] + second + duplicate[item_end:])
+    output_dir = tmp_path / "output"
+
+    result = import_wordpress.run([str(xml_file), "--output-dir", str(output_dir), "--jobs", "1"])
+
+    assert result == 0
+    assert (output_dir / "published.md").read_text(encoding="utf-8").endswith("Second")
+
+
+def test_import_run_reports_failed_post(tmp_path, monkeypatch, capsys):
+    """Test that a post that fails to convert is reported with its title."""
+    from hugotools.commands import import_wordpress
+
+    def fail(post):
+        raise ValueError("bad content")
+
+    monkeypatch.setattr(import_wordpress, "convert_post", fail)
+    xml_file = tmp_path / "export.xml"
+    xml_file.write_text(SAMPLE_EXPORT)
+
+    result = import_wordpress.run([str(xml_file), "--dry-run", "--jobs", "1"])
+
+    assert result == 1
+    captured = capsys.readouterr()
+    assert "[1/1] Published\n" in captured.out
+    assert "ERROR: bad content" in captured.err
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -5,7 +5,15 @@ from pathlib import Path
 
 import pytest
 
-from hugotools.commands.tag import HugoTagManager
+from hugotools.commands.tag import HugoTagManager, split_items
+from hugotools.common import FrontmatterCache
+
+
+def test_split_items():
+    """Test splitting comma-separated --add/--remove values."""
+    assert split_items("python, ai ,,python") == frozenset({"python", "ai"})
+    assert split_items(None) == frozenset()
+    assert split_items(" , ") == frozenset()
 
 
 def test_tag_manager_add_tags():
@@ -44,6 +52,27 @@ Content.
         assert "new-tag" in tags
 
 
+def test_tag_manager_save_keeps_frontmatter_cache_current(tmp_path, monkeypatch):
+    """Test that saved posts are served from the cache on the next run."""
+    content_dir = tmp_path / "posts"
+    content_dir.mkdir()
+    (content_dir / "test-post.md").write_text("---\ntitle: Test Post\ntags:\n  - existing\n---\n")
+    cache_file = tmp_path / "frontmatter.pkl"
+
+    manager = HugoTagManager(content_dir, FrontmatterCache(cache_file))
+    manager.load_posts()
+    manager.modify_metadata(manager.posts, "tags", add_items={"new-tag"}, remove_items=set())
+    manager.save_cache()
+
+    def fail_load_yaml(_):
+        raise AssertionError("frontmatter should come from the cache")
+
+    monkeypatch.setattr("hugotools.common.load_yaml", fail_load_yaml)
+    manager2 = HugoTagManager(content_dir, FrontmatterCache(cache_file))
+    manager2.load_posts()
+    assert manager2.posts[0].get_metadata_list("tags") == ["existing", "new-tag"]
+
+
 def test_tag_manager_remove_tags():
     """Test removing tags from posts."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -81,6 +110,58 @@ Content.
         assert "remove" not in tags
 
 
+def test_tag_manager_unchanged_posts_not_modified(tmp_path):
+    """Test that posts whose tags would not change are left alone."""
+    content_dir = tmp_path / "posts"
+    content_dir.mkdir()
+    post_file = content_dir / "test-post.md"
+    post_file.write_text("---\ntitle: Test Post\ntags:\n  - keep\n---\n")
+    original = post_file.read_text()
+
+    manager = HugoTagManager(content_dir)
+    manager.load_posts()
+
+    # Already present, absent, or both added and removed: nothing to do
+    modified = manager.modify_metadata(
+        manager.posts, "tags", add_items={"keep", "both"}, remove_items={"missing", "both"}
+    )
+
+    assert modified == 0
+    assert manager.modify_metadata(manager.posts, "tags", set(), set()) == 0
+    assert post_file.read_text() == original
+
+
+def test_tag_manager_modify_streamed_posts(tmp_path):
+    """Test that modify methods accept the lazily filtered posts directly."""
+    content_dir = tmp_path / "posts"
+    content_dir.mkdir()
+    (content_dir / "docker.md").write_text("---\ntitle: Docker Post\n---\n")
+    (content_dir / "other.md").write_text("---\ntitle: Other Post\n---\n")
+
+    manager = HugoTagManager(content_dir)
+    manager.load_posts()
+
+    posts = manager.iter_posts(title_pattern="docker")
+    assert manager.modify_metadata(posts, "tags", {"docker"}, set()) == 1
+    assert manager.modify_label(manager.iter_posts(select_all=True), "status", "done") == 2
+
+
+def test_tag_manager_quiet(tmp_path, capsys):
+    """Test that quiet mode applies changes without printing per-post details."""
+    content_dir = tmp_path / "posts"
+    content_dir.mkdir()
+    (content_dir / "test-post.md").write_text("---\ntitle: Test Post\ntags: [old]\n---\n")
+
+    manager = HugoTagManager(content_dir)
+    manager.load_posts()
+    capsys.readouterr()
+
+    modified = manager.modify_metadata(manager.posts, "tags", {"new"}, {"old"}, quiet=True)
+    assert modified == 1
+    assert capsys.readouterr().out == ""
+    assert manager.posts[0].get_metadata_list("tags") == ["new"]
+
+
 def test_tag_manager_dry_run():
     """Test dry run mode doesn't modify files."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -242,6 +323,46 @@ Content.
         assert result == 0
 
 
+def test_tag_run_with_jobs(tmp_path):
+    """Test that --jobs sets the number of workers used to load and save posts."""
+    content_dir = tmp_path / "posts"
+    content_dir.mkdir()
+    for i in range(3):
+        (content_dir / f"post{i}.md").write_text(f"---\ntitle: Post {i}\n---\n")
+
+    from hugotools.commands.tag import run
+
+    result = run(["--all", "--add", "tutorial", "--jobs", "2", "--content-dir", str(content_dir)])
+    assert result == 0
+
+    manager = HugoTagManager(content_dir, jobs=1)
+    manager.load_posts()
+    assert all(post.get_metadata_list("tags") == ["tutorial"] for post in manager.posts)
+
+
+def test_tag_run_ignores_empty_items(tmp_path):
+    """Test that stray commas and spaces in --add don't create empty tags."""
+    content_dir = tmp_path / "posts"
+    content_dir.mkdir()
+    (content_dir / "post.md").write_text("---\ntitle: Post\n---\n")
+
+    from hugotools.commands.tag import run
+
+    assert run(["--all", "--add", " python, ,ai,", "--content-dir", str(content_dir)]) == 0
+
+    manager = HugoTagManager(content_dir)
+    manager.load_posts()
+    assert manager.posts[0].get_metadata_list("tags") == ["ai", "python"]
+
+
+def test_tag_run_missing_content_dir(tmp_path, capsys):
+    """Test that run() reports a missing content directory and returns an error code."""
+    from hugotools.commands.tag import run
+
+    assert run(["--all", "--add", "python", "--content-dir", str(tmp_path / "missing")]) == 1
+    assert "does not exist" in capsys.readouterr().out
+
+
 def test_tag_run_no_selection_error():
     """Test that run() fails when no selection criteria provided."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -458,6 +579,23 @@ Content without tags.
         assert result == 0
 
 
+def test_tag_dump_summary_counts_values(tmp_path, capsys):
+    """Test that the dump summary lists the most-used values with their counts."""
+    content_dir = tmp_path / "posts"
+    content_dir.mkdir()
+    (content_dir / "one.md").write_text("---\ntitle: One\ntags: [python, docker]\n---\n")
+    (content_dir / "two.md").write_text("---\ntitle: Two\ntags: [python]\n---\n")
+
+    manager = HugoTagManager(content_dir)
+    manager.load_posts()
+    manager.dump_metadata(manager.posts, "tags", "list")
+
+    out = capsys.readouterr().out
+    assert "Summary: 2 unique values" in out
+    assert "All values: ['docker', 'python']" in out
+    assert "Most used: python (2), docker (1)" in out
+
+
 def test_tag_dump_label_with_missing_values():
     """Test dump mode for label field with some posts missing the field."""
     with tempfile.TemporaryDirectory() as tmpdir: